@@ -7,16 +7,24 @@ import sys
 import secrets
 from gen_tron_address_real import private_key_to_tron_address
 
+# Lines buffered in memory before a single writelines() call
+WRITE_BUFFER_LINES = 4096
+
 def generate_batch_addresses(count, output_file=None):
-    """Generate multiple addresses efficiently"""
+    """Generate multiple addresses efficiently
+
+    When output_file is given, results are streamed to disk and not kept
+    in memory, so the returned list is empty.
+    """
     print(f"Batch generating {count} Tron addresses...")
 
     results = []
+    buffer = []
 
     # Open output file if specified
     file_handle = None
     if output_file:
-        file_handle = open(output_file, 'w')
+        file_handle = open(output_file, 'w', buffering=1 << 20)
         print(f"Writing to file: {output_file}")
 
     try:
@@ -28,14 +36,14 @@ def generate_batch_addresses(count, output_file=None):
             # Generate corresponding address
             address = private_key_to_tron_address(private_key_hex)
 
-            # Store result
-            result = (private_key_hex, address)
-            results.append(result)
-
-            # Write to file immediately (streaming)
             if file_handle:
-                file_handle.write(f"{private_key_hex},{address}\n")
-                file_handle.flush()  # Ensure immediate write
+                # Stream to file in large chunks
+                buffer.append(f"{private_key_hex},{address}\n")
+                if len(buffer) >= WRITE_BUFFER_LINES:
+                    file_handle.writelines(buffer)
+                    buffer.clear()
+            else:
+                results.append((private_key_hex, address))
 
             # Print progress every 1000 addresses
             if (i + 1) % 1000 == 0:
@@ -50,6 +58,9 @@ def generate_batch_addresses(count, output_file=None):
 
     finally:
         if file_handle:
+            # Write remaining buffer
+            if buffer:
+                file_handle.writelines(buffer)
             file_handle.close()
 
 if __name__ == "__main__":
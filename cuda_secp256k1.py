@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+CUDA secp256k1 public key derivation for batches of private keys
+Each thread computes k*G for one key as a sum of 32 precomputed points,
+one per key byte, from a fixed-base table - no point doublings needed.
+Field elements are 8 little-endian 32-bit limbs held in uint64 words.
+"""
+import numpy as np
+from numba import cuda
+
+P = 2**256 - 2**32 - 977
+GX = 0x79BE667EF9DCBBAC55A06295CE870B07029BFCDB2DCE28D959F2815B16F81798
+GY = 0x483ADA7726A3C4655DA4FBFC0E1108A8FD17B448A68554199C47D08FFB10D4B8
+
+THREADS_PER_BLOCK = 128
+
+MASK = np.uint64(0xFFFFFFFF)
+SHIFT = np.uint64(32)
+ZERO = np.uint64(0)
+ONE = np.uint64(1)
+BYTE = np.uint64(0xFF)
+TOP_BIT = np.uint64(0x80000000)
+FOLD = np.uint64(977)  # 2^256 = 2^32 + 977 (mod p)
+
+P_LIMBS = np.array([(P >> (32 * i)) & 0xFFFFFFFF for i in range(8)], dtype=np.uint64)
+P_MINUS_2 = np.array([((P - 2) >> (32 * i)) & 0xFFFFFFFF for i in range(8)], dtype=np.uint64)
+
+@cuda.jit(device=True)
+def fe_fold(r, top):
+    """r += top * 2^256 mod p, return the carry out of 2^256"""
+    acc = r[0] + top * FOLD
+    r[0] = acc & MASK
+    acc = r[1] + top + (acc >> SHIFT)
+    r[1] = acc & MASK
+    carry = acc >> SHIFT
+    for i in range(2, 8):
+        acc = r[i] + carry
+        r[i] = acc & MASK
+        carry = acc >> SHIFT
+    return carry
+
+@cuda.jit(device=True)
+def fe_normalize(r):
+    """Reduce r (< 2^256) below p"""
+    s = cuda.local.array(8, np.uint64)
+    for i in range(8):
+        s[i] = r[i]
+    # s = r - p = r + (2^32 + 977) - 2^256; keep it if that did not go negative
+    if fe_fold(s, ONE):
+        for i in range(8):
+            r[i] = s[i]
+
+@cuda.jit(device=True)
+def fe_add(r, a, b):
+    carry = ZERO
+    for i in range(8):
+        acc = a[i] + b[i] + carry
+        r[i] = acc & MASK
+        carry = acc >> SHIFT
+    if carry:
+        fe_fold(r, ONE)
+    fe_normalize(r)
+
+@cuda.jit(device=True)
+def fe_sub(r, a, b):
+    borrow = ZERO
+    for i in range(8):
+        acc = a[i] + (MASK + ONE) - b[i] - borrow
+        r[i] = acc & MASK
+        borrow = ONE - (acc >> SHIFT)
+    if borrow:
+        carry = ZERO
+        for i in range(8):
+            acc = r[i] + P_LIMBS[i] + carry
+            r[i] = acc & MASK
+            carry = acc >> SHIFT
+
+@cuda.jit(device=True)
+def fe_mul(r, a, b):
+    """r = a * b mod p (r may alias a or b)"""
+    t = cuda.local.array(16, np.uint64)
+    for i in range(16):
+        t[i] = ZERO
+    for i in range(8):
+        carry = ZERO
+        for j in range(8):
+            acc = t[i + j] + a[i] * b[j] + carry
+            t[i + j] = acc & MASK
+            carry = acc >> SHIFT
+        t[i + 8] = carry
+
+    # Fold the high half back in: hi * 2^256 = hi * 2^32 + hi * 977
+    acc = t[0] + t[8] * FOLD
+    r[0] = acc & MASK
+    carry = acc >> SHIFT
+    for i in range(1, 8):
+        acc = t[i] + t[i + 8] * FOLD + t[i + 7] + carry
+        r[i] = acc & MASK
+        carry = acc >> SHIFT
+    if fe_fold(r, carry + t[15]):
+        fe_fold(r, ONE)
+    fe_normalize(r)
+
+@cuda.jit(device=True)
+def fe_inv(r, a):
+    """r = a^(p-2) = 1/a mod p"""
+    for i in range(8):
+        r[i] = ZERO
+    r[0] = ONE
+    for i in range(7, -1, -1):
+        word = P_MINUS_2[i]
+        for _ in range(32):
+            fe_mul(r, r, r)
+            if word & TOP_BIT:
+                fe_mul(r, r, a)
+            word = word << ONE
+
+@cuda.jit(device=True)
+def point_add_affine(X, Y, Z, x2, y2):
+    """(X, Y, Z) += (x2, y2); Jacobian plus affine, points must differ"""
+    z2 = cuda.local.array(8, np.uint64)
+    u2 = cuda.local.array(8, np.uint64)
+    s2 = cuda.local.array(8, np.uint64)
+    h = cuda.local.array(8, np.uint64)
+    rr = cuda.local.array(8, np.uint64)
+    h2 = cuda.local.array(8, np.uint64)
+    h3 = cuda.local.array(8, np.uint64)
+    t = cuda.local.array(8, np.uint64)
+
+    fe_mul(z2, Z, Z)
+    fe_mul(u2, x2, z2)
+    fe_mul(s2, y2, z2)
+    fe_mul(s2, s2, Z)
+    fe_sub(h, u2, X)
+    fe_sub(rr, s2, Y)
+    fe_mul(h2, h, h)
+    fe_mul(h3, h2, h)
+    fe_mul(t, X, h2)
+
+    # X3 = R^2 - H^3 - 2*X1*H^2
+    fe_mul(X, rr, rr)
+    fe_sub(X, X, h3)
+    fe_sub(X, X, t)
+    fe_sub(X, X, t)
+    # Y3 = R*(X1*H^2 - X3) - Y1*H^3
+    fe_sub(t, t, X)
+    fe_mul(t, t, rr)
+    fe_mul(h3, h3, Y)
+    fe_sub(Y, t, h3)
+    # Z3 = Z1*H
+    fe_mul(Z, Z, h)
+
+@cuda.jit
+def pubkey_batch(keys, table, out, count):
+    """Uncompressed public keys (x || y, 64 bytes) for count packed private keys"""
+    index = cuda.grid(1)
+    if index >= count:
+        return
+
+    X = cuda.local.array(8, np.uint64)
+    Y = cuda.local.array(8, np.uint64)
+    Z = cuda.local.array(8, np.uint64)
+
+    # Window w is byte w of the key counting from the least significant end.
+    # The running sum is below 256^w while the added point is v * 256^w,
+    # so the addition never hits the doubling case for keys in [1, n).
+    empty = True
+    for w in range(32):
+        v = keys[index * 32 + 31 - w]
+        if v == 0:
+            continue
+        if empty:
+            for i in range(8):
+                X[i] = table[w, v, 0, i]
+                Y[i] = table[w, v, 1, i]
+                Z[i] = ZERO
+            Z[0] = ONE
+            empty = False
+        else:
+            point_add_affine(X, Y, Z, table[w, v, 0], table[w, v, 1])
+
+    # Back to affine: x = X / Z^2, y = Y / Z^3
+    zinv = cuda.local.array(8, np.uint64)
+    zinv2 = cuda.local.array(8, np.uint64)
+    fe_inv(zinv, Z)
+    fe_mul(zinv2, zinv, zinv)
+    fe_mul(X, X, zinv2)
+    fe_mul(zinv2, zinv2, zinv)
+    fe_mul(Y, Y, zinv2)
+
+    base = index * 64
+    for i in range(8):
+        offset = base + 28 - 4 * i
+        for k in range(4):
+            out[offset + k] = (X[i] >> np.uint64(24 - 8 * k)) & BYTE
+            out[offset + 32 + k] = (Y[i] >> np.uint64(24 - 8 * k)) & BYTE
+
+def _affine_add(a, b):
+    """Host-side affine point addition (handles doubling)"""
+    if a == b:
+        slope = 3 * a[0] * a[0] * pow(2 * a[1], -1, P) % P
+    else:
+        slope = (b[1] - a[1]) * pow(b[0] - a[0], -1, P) % P
+    x = (slope * slope - a[0] - b[0]) % P
+    return x, (slope * (a[0] - x) - a[1]) % P
+
+def build_table():
+    """table[w, v] = v * 256^w * G as affine limbs, for v in 1..255"""
+    table = np.zeros((32, 256, 2, 8), dtype=np.uint64)
+    base = (GX, GY)
+    for w in range(32):
+        point = base
+        for v in range(1, 256):
+            for i in range(8):
+                table[w, v, 0, i] = (point[0] >> (32 * i)) & 0xFFFFFFFF
+                table[w, v, 1, i] = (point[1] >> (32 * i)) & 0xFFFFFFFF
+            point = _affine_add(point, base)
+        base = point
+    return table
+
+# Per-process device copy of the table, uploaded on first use
+_device_table = None
+
+def is_available():
+    return cuda.is_available()
+
+def derive_public_keys(private_key_buffer, count):
+    """Public keys for count packed private keys (each in [1, n)), packed 64 bytes each"""
+    global _device_table
+    if _device_table is None:
+        _device_table = cuda.to_device(build_table())
+
+    keys = cuda.to_device(np.frombuffer(private_key_buffer, dtype=np.uint8, count=32 * count))
+    out = cuda.device_array(64 * count, dtype=np.uint8)
+    blocks = (count + THREADS_PER_BLOCK - 1) // THREADS_PER_BLOCK
+    pubkey_batch[blocks, THREADS_PER_BLOCK](keys, _device_table, out, count)
+    return out.copy_to_host().tobytes()
@@ -6,13 +6,13 @@ Uses fastest possible crypto libraries and optimization techniques
 """
 import sys
 import os
-import secrets
 import concurrent.futures
-import threading
 import time
 import multiprocessing
-from queue import Queue
+import mmap
 import hashlib
+from binascii import hexlify
+from tron_utils import SECP256K1_RAW, derive_public_keys, random_private_keys, base58_25, tron_checksum
 
 # Try to import the fastest possible crypto libraries
 try:
@@ -39,159 +39,229 @@ except ImportError:
         print("Error: No keccak implementation available")
         sys.exit(1)
 
-# Optimized constants
-ALPHABET = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
-ALPHABET_ARRAY = [ord(c) for c in ALPHABET]
-BASE58_ALPHABET = bytes(ALPHABET, 'ascii')
-
-class ExtremePerformanceGenerator:
-    def __init__(self, num_processes=None, batch_size=1000):
-        # Use all CPU cores by default
-        self.num_processes = num_processes or multiprocessing.cpu_count()
-        self.batch_size = batch_size
-        self.write_queue = Queue(maxsize=50000)
-        self.stats_lock = threading.Lock()
-        self.total_generated = 0
+# Batched Keccak-256: every public key of a batch in one compiled call
+try:
+    import numpy as np
+    from numba_keccak import keccak256_64_batch, warm_up as warm_up_keccak
+    KECCAK_BATCH = True
+except ImportError:
+    KECCAK_BATCH = False
 
-        print(f"Initializing with {self.num_processes} processes, batch size {batch_size}")
+try:
+    from numba_base58 import base58_encode_25, base58_encode_25_batch, warm_up as warm_up_base58
+    BASE58_LIB = "numba"
+except ImportError:
+    BASE58_LIB = "python"
 
-    def fast_keccak256(self, data):
-        """Fastest possible Keccak-256 implementation"""
-        if KECCAK_LIB == "pycryptodome":
-            k = keccak.new(digest_bits=256)
-            k.update(data)
-            return k.digest()
-        else:
-            # Fallback to sha3_256 (close enough for speed testing)
-            return hashlib.sha3_256(data).digest()
-
-    def optimized_base58_encode(self, data):
-        """Ultra-optimized base58 encoding"""
-        # Convert to integer
-        num = int.from_bytes(data, 'big')
-
-        if num == 0:
-            return ALPHABET[0]
-
-        # Pre-allocate result array
-        result = []
-        while num > 0:
-            num, remainder = divmod(num, 58)
-            result.append(ALPHABET[remainder])
-
-        # Handle leading zeros
-        leading_zeros = 0
-        for byte in data:
-            if byte == 0:
-                leading_zeros += 1
-            else:
-                break
-
-        return ALPHABET[0] * leading_zeros + ''.join(reversed(result))
-
-    def ultra_fast_address_generation(self, private_key_bytes):
-        """Fastest possible address generation"""
+# Optional GPU backend for the k*G stage (numba.cuda)
+try:
+    import cuda_secp256k1
+    CUDA_SECP256K1 = True
+except ImportError:
+    CUDA_SECP256K1 = False
+
+# Address encoder for the hot path
+encode_address = base58_encode_25 if BASE58_LIB == "numba" else base58_25
+
+# Every output line has the same width: 64 hex chars, ',', a 34-character
+# address (always, with the 0x41 prefix) and '\n'
+LINE_SIZE = 64 + 1 + 34 + 1
+
+def physical_cpus():
+    """One CPU id per physical core we are allowed to run on
+
+    SMT siblings share execution ports, and the EC/hash pipeline is bound
+    by integer multiply/add throughput, so two workers on one core only
+    get in each other's way. Falls back to every allowed CPU when the
+    topology is unavailable (non-Linux).
+    """
+    if not hasattr(os, 'sched_getaffinity'):
+        return list(range(multiprocessing.cpu_count()))
+
+    allowed = sorted(os.sched_getaffinity(0))
+    cpus = []
+    seen = set()
+    for cpu in allowed:
         try:
-            if CRYPTO_LIB == "coincurve":
-                # Use coincurve - fastest secp256k1 implementation
-                private_key = coincurve.PrivateKey(private_key_bytes)
-                public_key_bytes = private_key.public_key.format(compressed=False)[1:]  # Remove 0x04 prefix
-            else:
-                # Fallback to ecdsa
-                sk = SigningKey.from_string(private_key_bytes, curve=SECP256k1)
-                vk = sk.get_verifying_key()
-                public_key_bytes = vk.to_string()
-
-            # Fast Keccak-256
-            keccak_hash = self.fast_keccak256(public_key_bytes)
-            ethereum_address = keccak_hash[-20:]
-
-            # Tron address formation
-            tron_address_hex = b'\x41' + ethereum_address
-
-            # Double SHA256 for checksum
-            checksum = hashlib.sha256(hashlib.sha256(tron_address_hex).digest()).digest()[:4]
-            full_address = tron_address_hex + checksum
-
-            # Fast base58 encoding
-            return self.optimized_base58_encode(full_address)
-
-        except Exception:
-            return None
-
-    def generate_batch_worker(self, batch_size):
-        """Generate a batch of addresses - optimized for speed"""
-        results = []
+            with open(f"/sys/devices/system/cpu/cpu{cpu}/topology/thread_siblings_list") as f:
+                siblings = f.read().strip()
+        except OSError:
+            siblings = str(cpu)
+        if siblings not in seen:
+            seen.add(siblings)
+            cpus.append(cpu)
+    return cpus
+
+# Per-worker state, set up by the pool initializer
+_output_map = None
+_progress = None
+
+def _init_worker(output_file, progress, cpus=None, next_cpu=None):
+    """Pool initializer: pin to a physical core and map the presized output file"""
+    global _output_map, _progress
+    if cpus and hasattr(os, 'sched_setaffinity'):
+        # Hand out cores round-robin, one per worker process
+        with next_cpu.get_lock():
+            slot = next_cpu.value
+            next_cpu.value += 1
+        try:
+            os.sched_setaffinity(0, {cpus[slot % len(cpus)]})
+        except OSError:
+            pass  # Keep the inherited affinity
+    if output_file:
+        with open(output_file, 'r+b') as f:
+            _output_map = mmap.mmap(f.fileno(), 0)
+    _progress = progress
 
-        for _ in range(batch_size):
-            # Generate secure random private key
-            private_key_bytes = secrets.token_bytes(32)
-            private_key_hex = private_key_bytes.hex()
+class ExtremePerformanceGenerator:
+    def __init__(self, num_processes=None, batch_size=1000, backend="cpu"):
+        # One worker per physical core by default (SMT siblings skipped)
+        self.cpus = physical_cpus()
+        self.num_processes = num_processes or len(self.cpus)
+        self.batch_size = batch_size
+        self.backend = backend
 
-            # Generate address
-            address = self.ultra_fast_address_generation(private_key_bytes)
+        if backend not in ("cpu", "cuda"):
+            raise ValueError(f"Unknown backend: {backend}")
+        if backend == "cuda" and not (CUDA_SECP256K1 and cuda_secp256k1.is_available()):
+            raise ValueError("CUDA backend needs numba with a CUDA device")
 
-            if address:
-                results.append((private_key_hex, address))
+        # Compile the JIT kernels once here so forked workers inherit them
+        if KECCAK_BATCH:
+            warm_up_keccak()
+        if BASE58_LIB == "numba":
+            warm_up_base58()
 
-        return results
+        print(f"Initializing with {self.num_processes} processes, batch size {batch_size}")
 
-    def process_worker(self, total_per_process, process_id):
-        """Worker process for generating addresses"""
+    def keccak256_batch(self, data_list):
+        """Keccak-256 over a whole batch of inputs in a single pass"""
+        if KECCAK_LIB == "pycryptodome":
+            keccak_new = keccak.new
+            return [keccak_new(data=data, digest_bits=256).digest() for data in data_list]
+        sha3_256 = hashlib.sha3_256
+        return [sha3_256(data).digest() for data in data_list]
+
+    def derive_public_key(self, private_key_bytes):
+        """Uncompressed secp256k1 public key without the 0x04 prefix"""
+        if CRYPTO_LIB == "coincurve":
+            # Use coincurve - fastest secp256k1 implementation
+            private_key = coincurve.PrivateKey(private_key_bytes)
+            return private_key.public_key.format(compressed=False)[1:]  # Remove 0x04 prefix
+
+        # Fallback to ecdsa
+        sk = SigningKey.from_string(private_key_bytes, curve=SECP256k1)
+        return sk.get_verifying_key().to_string()
+
+    def derive_public_keys_batch(self, private_key_buffer, count):
+        """Public keys for count packed private keys, packed 64 bytes each"""
+        if self.backend == "cuda":
+            # Whole batch in one kernel launch; hashing stays on the CPU
+            return cuda_secp256k1.derive_public_keys(private_key_buffer, count)
+
+        if SECP256K1_RAW:
+            return derive_public_keys(private_key_buffer, count)
+
+        if CRYPTO_LIB == "coincurve":
+            # Skip the PrivateKey wrapper - go straight to pubkey creation
+            from_secret = coincurve.PublicKey.from_secret
+            return b''.join([
+                from_secret(private_key_buffer[offset:offset + 32]).format(compressed=False)[1:]
+                for offset in range(0, count * 32, 32)
+            ])
+
+        derive = self.derive_public_key
+        return b''.join([derive(private_key_buffer[offset:offset + 32]) for offset in range(0, count * 32, 32)])
+
+    def tron_payloads_batch(self, public_key_buffer, count):
+        """0x41 + last 20 Keccak bytes for every packed public key, 25 bytes each
+
+        The last 4 bytes of every payload are left for checksum_batch.
+        """
+        if KECCAK_BATCH:
+            # Every digest of the batch from one compiled call
+            digests = np.frombuffer(keccak256_64_batch(public_key_buffer, count), dtype=np.uint8).reshape(count, 32)
+            payloads = np.zeros((count, 25), dtype=np.uint8)
+            payloads[:, 0] = 0x41
+            payloads[:, 1:21] = digests[:, 12:]
+            return bytearray(payloads)
+
+        # bytes slices: pycryptodome hashes bytes much faster than
+        # memoryview or bytearray input
+        public_keys = bytes(public_key_buffer)
+        digests = self.keccak256_batch([public_keys[offset:offset + 64] for offset in range(0, 64 * count, 64)])
+
+        payloads = bytearray(25 * count)
+        offset = 0
+        for digest in digests:
+            payloads[offset] = 0x41
+            payloads[offset + 1:offset + 21] = digest[12:]
+            offset += 25
+        return payloads
+
+    def checksum_batch(self, payloads, count):
+        """Fill in the 4-byte double SHA256 checksum of every payload in place
+
+        Each 0x41 + hash payload is hashed straight from its slot in the
+        batch buffer, so no per-key copy of it is made.
+        """
+        checksum = tron_checksum
+        with memoryview(payloads) as view:
+            for offset in range(0, 25 * count, 25):
+                view[offset + 21:offset + 25] = checksum(view[offset:offset + 21])
+
+    def base58_batch(self, payloads, count):
+        """Base58 addresses for every payload, packed 34 ASCII bytes each"""
+        if BASE58_LIB == "numba":
+            # The whole batch in one compiled call
+            return base58_encode_25_batch(payloads, count)
+
+        encode = encode_address
+        return ''.join([
+            encode(payloads[offset:offset + 25]) for offset in range(0, 25 * count, 25)
+        ]).encode('ascii')
+
+    def generate_batch_buffers(self, batch_size):
+        """Run the pipeline over whole-batch buffers (structure of arrays)
+
+        Returns the packed private keys (32 bytes each) and addresses
+        (34 bytes each); every stage is one pass over contiguous memory.
+        """
+        private_key_buffer = random_private_keys(batch_size)
+        public_key_buffer = self.derive_public_keys_batch(private_key_buffer, batch_size)
+        payloads = self.tron_payloads_batch(public_key_buffer, batch_size)
+        self.checksum_batch(payloads, batch_size)
+        return private_key_buffer, self.base58_batch(payloads, batch_size)
+
+    def generate_batch_block(self, batch_size):
+        """Generate a batch as ready-to-write CSV bytes"""
+        private_key_buffer, addresses = self.generate_batch_buffers(batch_size)
+
+        # Hex-encode every private key of the batch in a single call
+        hex_keys = hexlify(private_key_buffer)
+        return b''.join([
+            hex_keys[index * 64:index * 64 + 64] + b',' + addresses[index * 34:index * 34 + 34] + b'\n'
+            for index in range(batch_size)
+        ])
+
+    def process_worker(self, total_per_process, process_id, start_index):
+        """Worker process: write batches into its own slice of the mapped output"""
         generated = 0
-        local_results = []
+        offset = start_index * LINE_SIZE
 
         while generated < total_per_process:
             current_batch = min(self.batch_size, total_per_process - generated)
-            batch_results = self.generate_batch_worker(current_batch)
-
-            # Queue results for writing
-            for result in batch_results:
-                self.write_queue.put(result)
-
-            generated += len(batch_results)
-            local_results.extend(batch_results)
-
-            # Update global stats
-            with self.stats_lock:
-                self.total_generated += len(batch_results)
-
-        return len(local_results)
+            blob = self.generate_batch_block(current_batch)
 
-    def writer_worker(self, output_file, total_target):
-        """Dedicated writer worker for file I/O"""
-        if not output_file:
-            return
+            if _output_map is not None:
+                _output_map[offset:offset + len(blob)] = blob
+                offset += len(blob)
 
-        written = 0
-        buffer = []
-        buffer_size = 5000  # Large buffer for efficiency
+            generated += current_batch
+            # Only this worker writes its slot, so no lock is needed
+            _progress[process_id] = generated
 
-        with open(output_file, 'w') as f:
-            while written < total_target:
-                try:
-                    item = self.write_queue.get(timeout=2)
-                    if item is None:  # Poison pill
-                        break
-
-                    buffer.append(f"{item[0]},{item[1]}\n")
-                    written += 1
-
-                    # Flush buffer when full
-                    if len(buffer) >= buffer_size:
-                        f.writelines(buffer)
-                        f.flush()
-                        buffer = []
-
-                    self.write_queue.task_done()
-
-                except:
-                    continue
-
-            # Write remaining buffer
-            if buffer:
-                f.writelines(buffer)
-                f.flush()
+        return generated
 
     def generate_extreme_performance(self, count, output_file=None):
         """Generate addresses with extreme performance optimization"""
@@ -201,17 +271,23 @@ class ExtremePerformanceGenerator:
         # Calculate work distribution
         addresses_per_process = count // self.num_processes
 
-        # Start writer worker
-        writer_thread = None
+        # Size the output up front; each worker maps it and fills its own slice
         if output_file:
-            writer_thread = threading.Thread(
-                target=self.writer_worker,
-                args=(output_file, count)
-            )
-            writer_thread.start()
-
-        # Start process pool
-        with concurrent.futures.ProcessPoolExecutor(max_workers=self.num_processes) as executor:
+            with open(output_file, 'wb') as f:
+                f.truncate(count * LINE_SIZE)
+
+        # CUDA contexts do not survive fork, so GPU feeders are spawned
+        context = multiprocessing.get_context("spawn" if self.backend == "cuda" else None)
+
+        # One progress slot per worker, summed by the parent
+        progress = context.Array('q', self.num_processes, lock=False)
+
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=self.num_processes,
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(output_file, progress, self.cpus, context.Value('i', 0))
+        ) as executor:
             futures = []
 
             for process_id in range(self.num_processes):
@@ -223,30 +299,28 @@ class ExtremePerformanceGenerator:
                 future = executor.submit(
                     self.process_worker,
                     process_count,
-                    process_id
+                    process_id,
+                    process_id * addresses_per_process
                 )
                 futures.append(future)
 
-            # Monitor progress with less frequent updates for performance
+            # Monitor progress until every worker has finished
             last_reported = 0
-            while self.total_generated < count:
-                time.sleep(0.05)  # Check more frequently
-                current = self.total_generated
+            pending = futures
+            while pending:
+                _, pending = concurrent.futures.wait(pending, timeout=0.5)
+                current = sum(progress)
 
                 if current >= last_reported + 25000:  # Report every 25k
                     elapsed = time.time() - start_time
                     rate = current / elapsed if elapsed > 0 else 0
-                    progress = (current / count) * 100
-                    print(f"  🔥 Progress: {progress:.1f}% | Generated: {current} | Rate: {rate:.0f}/sec")
+                    percent = (current / count) * 100
+                    print(f"  🔥 Progress: {percent:.1f}% | Generated: {current} | Rate: {rate:.0f}/sec")
                     last_reported = current
 
-            # Wait for all processes
-            concurrent.futures.wait(futures)
-
-        # Signal writer to stop
-        if writer_thread:
-            self.write_queue.put(None)  # Poison pill
-            writer_thread.join()
+            # Surface worker errors
+            for future in futures:
+                future.result()
 
         end_time = time.time()
         elapsed = end_time - start_time
@@ -265,8 +339,9 @@ class ExtremePerformanceGenerator:
 
 def main():
     if len(sys.argv) < 2:
-        print("Usage: python3 extreme_performance_generator.py <count> [output_file] [processes] [batch_size]")
+        print("Usage: python3 extreme_performance_generator.py <count> [output_file] [processes] [batch_size] [cpu|cuda]")
         print("Example: python3 extreme_performance_generator.py 100000 output.txt 8 2000")
+        print("         python3 extreme_performance_generator.py 10000000 output.txt 4 1000000 cuda")
         sys.exit(1)
 
     try:
@@ -274,12 +349,13 @@ def main():
         output_file = sys.argv[2] if len(sys.argv) > 2 else None
         num_processes = int(sys.argv[3]) if len(sys.argv) > 3 else None
         batch_size = int(sys.argv[4]) if len(sys.argv) > 4 else 1000
+        backend = sys.argv[5] if len(sys.argv) > 5 else "cpu"
 
         if count <= 0 or count > 50000000:
             print("Error: Count must be between 1 and 50,000,000")
             sys.exit(1)
 
-        generator = ExtremePerformanceGenerator(num_processes, batch_size)
+        generator = ExtremePerformanceGenerator(num_processes, batch_size, backend)
         rate = generator.generate_extreme_performance(count, output_file)
 
         print(f"\nFinal Result: {rate:.0f} addresses/second")
@@ -1,51 +1,53 @@
 #!/usr/bin/env python3
-import hashlib
+"""
+Tron address from a private key
+Thin wrapper around gen_tron_address_real; the SHA256 placeholder below is
+only reachable when this file is run as a script without the crypto libraries
+"""
 import sys
 
-def sha256(data):
-    """SHA256 hash"""
-    return hashlib.sha256(data).digest()
+try:
+    from gen_tron_address_real import private_key_to_tron_address
+    REAL_CRYPTO = True
+except ImportError:
+    REAL_CRYPTO = False
 
-def keccak256(data):
-    """Keccak-256 hash (since we don't have the keccak library, use a simple workaround)"""
-    # For now, use SHA3-256 as approximation (not exactly the same as Keccak but close enough for demo)
-    return hashlib.sha3_256(data).digest()
+BASE58_ALPHABET = b"123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
 
-def base58_encode(data):
+def _demo_base58_encode(data):
     """Simple base58 encoding"""
-    alphabet = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
-
     # Convert bytes to integer
     num = int.from_bytes(data, 'big')
 
-    # Convert to base58
-    encoded = ""
+    # Convert to base58, filling a preallocated buffer from the tail
+    size = len(data) * 138 // 100 + 1
+    buf = bytearray(size)
+    pos = size
     while num > 0:
         num, remainder = divmod(num, 58)
-        encoded = alphabet[remainder] + encoded
+        pos -= 1
+        buf[pos] = BASE58_ALPHABET[remainder]
 
     # Handle leading zeros
     for byte in data:
         if byte == 0:
-            encoded = alphabet[0] + encoded
+            pos -= 1
+            buf[pos] = BASE58_ALPHABET[0]
         else:
             break
 
-    return encoded
+    return buf[pos:].decode('ascii')
 
-def private_key_to_tron_address(private_key_hex):
-    """Convert private key to Tron address (simplified version)"""
-    try:
-        # For now, generate a placeholder that looks correct
-        # In a real implementation, you would:
-        # 1. private_key -> public_key (secp256k1)
-        # 2. public_key -> ethereum_address (keccak256)
-        # 3. ethereum_address -> tron_address (0x41 prefix + checksum)
+def _demo_private_key_to_tron_address(private_key_hex):
+    """Placeholder address from SHA256 of the private key - NOT a real Tron address"""
+    import hashlib
 
-        # Simple demo version - create a consistent "address" from private key
-        private_bytes = bytes.fromhex(private_key_hex)
+    def sha256(data):
+        return hashlib.sha256(data).digest()
 
+    try:
         # Create a fake "public key hash" by hashing the private key
+        private_bytes = bytes.fromhex(private_key_hex)
         fake_pubkey_hash = sha256(private_bytes)[:20]  # Take first 20 bytes
 
         # Add Tron prefix (0x41)
@@ -54,13 +56,8 @@ def private_key_to_tron_address(private_key_hex):
         # Calculate checksum
         checksum = sha256(sha256(tron_hex))[:4]
 
-        # Combine address and checksum
-        full_address = tron_hex + checksum
-
-        # Encode in base58
-        address = base58_encode(full_address)
-
-        return address
+        # Combine address and checksum, encode in base58
+        return _demo_base58_encode(tron_hex + checksum)
 
     except Exception as e:
         return f"Error: {str(e)}"
@@ -75,5 +72,9 @@ if __name__ == "__main__":
         print("Error: Private key must be 64 hex characters")
         sys.exit(1)
 
-    address = private_key_to_tron_address(private_key)
-    print(address)
\ No newline at end of file
+    if REAL_CRYPTO:
+        address = private_key_to_tron_address(private_key)
+    else:
+        print("Warning: ecdsa/pycryptodome not installed, printing a placeholder address", file=sys.stderr)
+        address = _demo_private_key_to_tron_address(private_key)
+    print(address)
@@ -4,6 +4,8 @@ import sys
 from ecdsa import SigningKey, SECP256k1
 from Crypto.Hash import keccak
 
+BASE58_ALPHABET = b"123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+
 def sha256(data):
     """SHA256 hash"""
     return hashlib.sha256(data).digest()
@@ -16,29 +18,31 @@ def keccak256(data):
 
 def base58_encode(data):
     """Base58 encoding for Bitcoin/Tron addresses"""
-    alphabet = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
-
     # Convert bytes to integer
     num = int.from_bytes(data, 'big')
 
     # Handle zero case
     if num == 0:
-        return alphabet[0]
+        return chr(BASE58_ALPHABET[0])
 
-    # Convert to base58
-    encoded = ""
+    # Convert to base58, filling a preallocated buffer from the tail
+    size = len(data) * 138 // 100 + 1
+    buf = bytearray(size)
+    pos = size
     while num > 0:
         num, remainder = divmod(num, 58)
-        encoded = alphabet[remainder] + encoded
+        pos -= 1
+        buf[pos] = BASE58_ALPHABET[remainder]
 
     # Handle leading zeros
     for byte in data:
         if byte == 0:
-            encoded = alphabet[0] + encoded
+            pos -= 1
+            buf[pos] = BASE58_ALPHABET[0]
         else:
             break
 
-    return encoded
+    return buf[pos:].decode('ascii')
 
 def private_key_to_tron_address(private_key_hex):
     """Convert private key to Tron address using correct cryptographic methods"""
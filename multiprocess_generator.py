@@ -4,10 +4,11 @@ Multiprocessing Coincurve Generator
 Use multiprocessing to bypass Python GIL for true parallelism
 """
 import sys
-import secrets
 import multiprocessing
 import time
 import hashlib
+from binascii import hexlify
+from tron_utils import random_private_keys, base58_25
 
 try:
     import coincurve
@@ -23,61 +24,57 @@ except ImportError:
     print("❌ Keccak required")
     sys.exit(1)
 
-ALPHABET = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+# Private keys drawn per os.urandom call
+RANDOM_BLOCK = 1024
 
-def fast_base58_encode(data):
-    """Optimized base58 encoding"""
-    num = int.from_bytes(data, 'big')
-    if num == 0:
-        return ALPHABET[0]
-
-    encoded = []
-    while num > 0:
-        num, remainder = divmod(num, 58)
-        encoded.append(ALPHABET[remainder])
-
-    leading_zeros = 0
-    for byte in data:
-        if byte == 0:
-            leading_zeros += 1
-        else:
-            break
-
-    return ALPHABET[0] * leading_zeros + ''.join(reversed(encoded))
+# Address encoder: JIT-compiled fixed-size encoder if numba is installed
+try:
+    from numba_base58 import base58_encode_25 as encode_address, warm_up
+    warm_up()  # Compile (or load the cache) before the pool forks
+except ImportError:
+    encode_address = base58_25
 
 def generate_address(private_key_bytes):
-    """Generate address using coincurve"""
-    try:
-        private_key = coincurve.PrivateKey(private_key_bytes)
-        public_key_bytes = private_key.public_key.format(compressed=False)[1:]
+    """Generate address using coincurve
 
-        k = keccak.new(digest_bits=256)
-        k.update(public_key_bytes)
-        keccak_hash = k.digest()
-        ethereum_address = keccak_hash[-20:]
+    The key must already be in [1, n); random_private_keys range-checks
+    whole blocks, so there is no per-address exception handling here.
+    """
+    private_key = coincurve.PrivateKey(private_key_bytes)
+    public_key_bytes = private_key.public_key.format(compressed=False)[1:]
 
-        tron_address_hex = b'\x41' + ethereum_address
-        checksum = hashlib.sha256(hashlib.sha256(tron_address_hex).digest()).digest()[:4]
-        full_address = tron_address_hex + checksum
+    k = keccak.new(digest_bits=256)
+    k.update(public_key_bytes)
+    keccak_hash = k.digest()
+    ethereum_address = keccak_hash[-20:]
 
-        return fast_base58_encode(full_address)
-    except:
-        return None
+    tron_address_hex = b'\x41' + ethereum_address
+    checksum = hashlib.sha256(hashlib.sha256(tron_address_hex).digest()).digest()[:4]
+    full_address = tron_address_hex + checksum
+
+    return encode_address(full_address)
 
 def worker_process(count_per_process):
-    """Worker process function"""
+    """Worker process function, returns (private_key_bytes, address) tuples"""
     results = []
 
-    for i in range(count_per_process):
-        private_key_bytes = secrets.token_bytes(32)
-        private_key_hex = private_key_bytes.hex()
-        address = generate_address(private_key_bytes)
+    for start in range(0, count_per_process, RANDOM_BLOCK):
+        block = min(RANDOM_BLOCK, count_per_process - start)
+        keys = random_private_keys(block)
 
-        if address:
-            results.append((private_key_hex, address))
+        for offset in range(0, 32 * block, 32):
+            private_key_bytes = keys[offset:offset + 32]
+            results.append((private_key_bytes, generate_address(private_key_bytes)))
 
     return results
 
+def format_records(records):
+    """CSV lines for (private_key_bytes, address) records as one bytes blob"""
+    return b''.join([
+        hexlify(private_key_bytes) + b',' + address.encode('ascii') + b'\n'
+        for private_key_bytes, address in records
+    ])
+
 def test_multiprocessing(total_count, num_processes=None):
     """Test with multiprocessing"""
     if num_processes is None:
@@ -152,9 +149,8 @@ def main():
         # Write to file if specified
         if output_file and results:
             print(f"💾 Writing to {output_file}...")
-            with open(output_file, 'w') as f:
-                for private_key, address in results:
-                    f.write(f"{private_key},{address}\n")
+            with open(output_file, 'wb') as f:
+                f.write(format_records(results))
             print(f"✅ Saved {len(results)} addresses to {output_file}")
 
     except KeyboardInterrupt:
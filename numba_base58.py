@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Numba JIT base58 encoder for 25-byte Tron address payloads
+The payload is packed into 7-byte limbs so the long division by 58
+runs on native 64-bit integers instead of Python big ints
+"""
+import numpy as np
+from numba import njit
+
+ALPHABET = np.frombuffer(b"123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz", dtype=np.uint8)
+
+# 25 payload bytes encode to at most 35 base58 digits
+MAX_ENCODED_LENGTH = 35
+
+@njit(cache=True, boundscheck=False)
+def encode_25_into(data, alphabet, out):
+    """Write base58 digits of data into the tail of out, return start index"""
+    # Big-endian limbs of 4 + 7 + 7 + 7 bytes; (58 << 56) still fits in int64
+    l0 = 0
+    for i in range(0, 4):
+        l0 = (l0 << 8) | data[i]
+    l1 = 0
+    for i in range(4, 11):
+        l1 = (l1 << 8) | data[i]
+    l2 = 0
+    for i in range(11, 18):
+        l2 = (l2 << 8) | data[i]
+    l3 = 0
+    for i in range(18, 25):
+        l3 = (l3 << 8) | data[i]
+
+    pos = MAX_ENCODED_LENGTH
+    while l0 or l1 or l2 or l3:
+        remainder = l0 % 58
+        l0 //= 58
+        current = (remainder << 56) | l1
+        l1 = current // 58
+        remainder = current % 58
+        current = (remainder << 56) | l2
+        l2 = current // 58
+        remainder = current % 58
+        current = (remainder << 56) | l3
+        l3 = current // 58
+        remainder = current % 58
+        pos -= 1
+        out[pos] = alphabet[remainder]
+
+    # Handle leading zeros
+    i = 0
+    while i < 25 and data[i] == 0:
+        pos -= 1
+        out[pos] = alphabet[0]
+        i += 1
+
+    return pos
+
+# A 0x41-prefixed Tron payload always encodes to exactly this many digits
+TRON_ADDRESS_LENGTH = 34
+
+@njit(cache=True, boundscheck=False, nogil=True)
+def encode_25_batch_into(data, count, alphabet, out):
+    """Base58 of count packed 25-byte Tron payloads into count packed 34-byte addresses"""
+    digits = np.empty(MAX_ENCODED_LENGTH, dtype=np.uint8)
+    for i in range(count):
+        pos = encode_25_into(data[i * 25:i * 25 + 25], alphabet, digits)
+        if pos != MAX_ENCODED_LENGTH - TRON_ADDRESS_LENGTH:
+            raise ValueError("Payload does not encode to a 34-character Tron address")
+        out[i * TRON_ADDRESS_LENGTH:(i + 1) * TRON_ADDRESS_LENGTH] = digits[pos:]
+
+@njit(cache=True, boundscheck=False, nogil=True)
+def encode_tron_batch_into(payloads, checksums, count, alphabet, out):
+    """Like encode_25_batch_into, with the 21-byte payloads and 4-byte checksums in separate buffers"""
+    data = np.empty(25, dtype=np.uint8)
+    digits = np.empty(MAX_ENCODED_LENGTH, dtype=np.uint8)
+    for i in range(count):
+        data[:21] = payloads[i * 21:i * 21 + 21]
+        data[21:] = checksums[i * 4:i * 4 + 4]
+        pos = encode_25_into(data, alphabet, digits)
+        if pos != MAX_ENCODED_LENGTH - TRON_ADDRESS_LENGTH:
+            raise ValueError("Payload does not encode to a 34-character Tron address")
+        out[i * TRON_ADDRESS_LENGTH:(i + 1) * TRON_ADDRESS_LENGTH] = digits[pos:]
+
+def base58_encode_25(data):
+    """Base58 encode a 25-byte address payload"""
+    out = np.empty(MAX_ENCODED_LENGTH, dtype=np.uint8)
+    pos = encode_25_into(np.frombuffer(data, dtype=np.uint8), ALPHABET, out)
+    return out[pos:].tobytes().decode('ascii')
+
+def base58_encode_25_bytes(data):
+    """Base58 encode a 25-byte address payload to ASCII bytes"""
+    out = np.empty(MAX_ENCODED_LENGTH, dtype=np.uint8)
+    pos = encode_25_into(np.frombuffer(data, dtype=np.uint8), ALPHABET, out)
+    return out[pos:].tobytes()
+
+def base58_encode_25_batch(data, count):
+    """Base58 addresses of count packed 25-byte Tron payloads, packed 34 ASCII bytes each"""
+    out = np.empty(TRON_ADDRESS_LENGTH * count, dtype=np.uint8)
+    encode_25_batch_into(np.frombuffer(data, dtype=np.uint8, count=25 * count), count, ALPHABET, out)
+    return out.tobytes()
+
+def base58_encode_tron_batch(payloads, checksums, count):
+    """Base58 addresses of count packed 21-byte payloads and their packed 4-byte checksums"""
+    out = np.empty(TRON_ADDRESS_LENGTH * count, dtype=np.uint8)
+    encode_tron_batch_into(
+        np.frombuffer(payloads, dtype=np.uint8, count=21 * count),
+        np.frombuffer(checksums, dtype=np.uint8, count=4 * count),
+        count, ALPHABET, out,
+    )
+    return out.tobytes()
+
+def warm_up():
+    """Trigger JIT compilation (or load the on-disk cache) before forking workers"""
+    base58_encode_25(b'\x41' + bytes(24))
+    base58_encode_25_batch(b'\x41' + bytes(24), 1)
+    base58_encode_tron_batch(b'\x41' + bytes(20), bytes(4), 1)
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Numba JIT Keccak-256 for batches of 64-byte public keys
+One compiled call hashes a whole packed batch, so each key costs one
+Keccak-f[1600] permutation instead of a pycryptodome object round trip
+"""
+import numpy as np
+from numba import njit
+
+ROUND_CONSTANTS = np.array([
+    0x0000000000000001, 0x0000000000008082, 0x800000000000808A, 0x8000000080008000,
+    0x000000000000808B, 0x0000000080000001, 0x8000000080008081, 0x8000000000008009,
+    0x000000000000008A, 0x0000000000000088, 0x0000000080008009, 0x000000008000000A,
+    0x000000008000808B, 0x800000000000008B, 0x8000000000008089, 0x8000000000008003,
+    0x8000000000008002, 0x8000000000000080, 0x000000000000800A, 0x800000008000000A,
+    0x8000000080008081, 0x8000000000008080, 0x0000000080000001, 0x8000000080008008,
+], dtype=np.uint64)
+
+U1 = np.uint64(1)
+U63 = np.uint64(63)
+
+@njit(cache=True, boundscheck=False)
+def keccak_f1600(state):
+    """Keccak-f[1600] on the 25-lane state
+
+    Fully unrolled with the lanes in locals so they stay in registers;
+    LLVM then emits RORX/ANDN for the rotations and chi on BMI2 CPUs.
+    With ANDN each ~b & c in chi is one instruction, so the lane-complementing
+    transform (which only trades NOTs for ORs) has nothing left to remove.
+    """
+    a00, a01, a02, a03, a04, a05, a06, a07, a08, a09, a10, a11, a12 = state[0], state[1], state[2], state[3], state[4], state[5], state[6], state[7], state[8], state[9], state[10], state[11], state[12]
+    a13, a14, a15, a16, a17, a18, a19, a20, a21, a22, a23, a24 = state[13], state[14], state[15], state[16], state[17], state[18], state[19], state[20], state[21], state[22], state[23], state[24]
+    for rnd in range(24):
+        # Theta
+        c0 = a00 ^ a05 ^ a10 ^ a15 ^ a20
+        c1 = a01 ^ a06 ^ a11 ^ a16 ^ a21
+        c2 = a02 ^ a07 ^ a12 ^ a17 ^ a22
+        c3 = a03 ^ a08 ^ a13 ^ a18 ^ a23
+        c4 = a04 ^ a09 ^ a14 ^ a19 ^ a24
+        d0 = c4 ^ ((c1 << U1) | (c1 >> U63))
+        d1 = c0 ^ ((c2 << U1) | (c2 >> U63))
+        d2 = c1 ^ ((c3 << U1) | (c3 >> U63))
+        d3 = c2 ^ ((c4 << U1) | (c4 >> U63))
+        d4 = c3 ^ ((c0 << U1) | (c0 >> U63))
+
+        # Rho and pi
+        b00 = a00 ^ d0
+        t = a05 ^ d0
+        b16 = (t << np.uint64(36)) | (t >> np.uint64(28))
+        t = a10 ^ d0
+        b07 = (t << np.uint64(3)) | (t >> np.uint64(61))
+        t = a15 ^ d0
+        b23 = (t << np.uint64(41)) | (t >> np.uint64(23))
+        t = a20 ^ d0
+        b14 = (t << np.uint64(18)) | (t >> np.uint64(46))
+        t = a01 ^ d1
+        b10 = (t << np.uint64(1)) | (t >> np.uint64(63))
+        t = a06 ^ d1
+        b01 = (t << np.uint64(44)) | (t >> np.uint64(20))
+        t = a11 ^ d1
+        b17 = (t << np.uint64(10)) | (t >> np.uint64(54))
+        t = a16 ^ d1
+        b08 = (t << np.uint64(45)) | (t >> np.uint64(19))
+        t = a21 ^ d1
+        b24 = (t << np.uint64(2)) | (t >> np.uint64(62))
+        t = a02 ^ d2
+        b20 = (t << np.uint64(62)) | (t >> np.uint64(2))
+        t = a07 ^ d2
+        b11 = (t << np.uint64(6)) | (t >> np.uint64(58))
+        t = a12 ^ d2
+        b02 = (t << np.uint64(43)) | (t >> np.uint64(21))
+        t = a17 ^ d2
+        b18 = (t << np.uint64(15)) | (t >> np.uint64(49))
+        t = a22 ^ d2
+        b09 = (t << np.uint64(61)) | (t >> np.uint64(3))
+        t = a03 ^ d3
+        b05 = (t << np.uint64(28)) | (t >> np.uint64(36))
+        t = a08 ^ d3
+        b21 = (t << np.uint64(55)) | (t >> np.uint64(9))
+        t = a13 ^ d3
+        b12 = (t << np.uint64(25)) | (t >> np.uint64(39))
+        t = a18 ^ d3
+        b03 = (t << np.uint64(21)) | (t >> np.uint64(43))
+        t = a23 ^ d3
+        b19 = (t << np.uint64(56)) | (t >> np.uint64(8))
+        t = a04 ^ d4
+        b15 = (t << np.uint64(27)) | (t >> np.uint64(37))
+        t = a09 ^ d4
+        b06 = (t << np.uint64(20)) | (t >> np.uint64(44))
+        t = a14 ^ d4
+        b22 = (t << np.uint64(39)) | (t >> np.uint64(25))
+        t = a19 ^ d4
+        b13 = (t << np.uint64(8)) | (t >> np.uint64(56))
+        t = a24 ^ d4
+        b04 = (t << np.uint64(14)) | (t >> np.uint64(50))
+
+        # Chi
+        a00 = b00 ^ (~b01 & b02)
+        a01 = b01 ^ (~b02 & b03)
+        a02 = b02 ^ (~b03 & b04)
+        a03 = b03 ^ (~b04 & b00)
+        a04 = b04 ^ (~b00 & b01)
+        a05 = b05 ^ (~b06 & b07)
+        a06 = b06 ^ (~b07 & b08)
+        a07 = b07 ^ (~b08 & b09)
+        a08 = b08 ^ (~b09 & b05)
+        a09 = b09 ^ (~b05 & b06)
+        a10 = b10 ^ (~b11 & b12)
+        a11 = b11 ^ (~b12 & b13)
+        a12 = b12 ^ (~b13 & b14)
+        a13 = b13 ^ (~b14 & b10)
+        a14 = b14 ^ (~b10 & b11)
+        a15 = b15 ^ (~b16 & b17)
+        a16 = b16 ^ (~b17 & b18)
+        a17 = b17 ^ (~b18 & b19)
+        a18 = b18 ^ (~b19 & b15)
+        a19 = b19 ^ (~b15 & b16)
+        a20 = b20 ^ (~b21 & b22)
+        a21 = b21 ^ (~b22 & b23)
+        a22 = b22 ^ (~b23 & b24)
+        a23 = b23 ^ (~b24 & b20)
+        a24 = b24 ^ (~b20 & b21)
+
+        # Iota
+        a00 ^= ROUND_CONSTANTS[rnd]
+
+    state[0], state[1], state[2], state[3], state[4], state[5], state[6], state[7], state[8], state[9], state[10], state[11], state[12] = a00, a01, a02, a03, a04, a05, a06, a07, a08, a09, a10, a11, a12
+    state[13], state[14], state[15], state[16], state[17], state[18], state[19], state[20], state[21], state[22], state[23], state[24] = a13, a14, a15, a16, a17, a18, a19, a20, a21, a22, a23, a24
+
+
+@njit(cache=True, boundscheck=False)
+def keccak256_64_into(data, count, out):
+    """Keccak-256 of count packed 64-byte inputs into count packed 32-byte digests"""
+    state = np.zeros(25, dtype=np.uint64)
+
+    for i in range(count):
+        # Absorb the 64 input bytes as 8 little-endian lanes
+        for lane in range(25):
+            state[lane] = 0
+        for lane in range(8):
+            value = np.uint64(0)
+            for k in range(8):
+                value |= np.uint64(data[i * 64 + lane * 8 + k]) << np.uint64(8 * k)
+            state[lane] = value
+
+        # Keccak padding in the 136-byte rate: 0x01 after the input, 0x80 at the end
+        state[8] ^= np.uint64(0x01)
+        state[16] ^= np.uint64(0x8000000000000000)
+        keccak_f1600(state)
+
+        # Squeeze the first 4 lanes
+        for lane in range(4):
+            value = state[lane]
+            for k in range(8):
+                out[i * 32 + lane * 8 + k] = (value >> np.uint64(8 * k)) & np.uint64(0xFF)
+
+def keccak256_64_batch(data, count):
+    """Keccak-256 digests (32 bytes each, packed) of count packed 64-byte inputs"""
+    out = np.empty(32 * count, dtype=np.uint8)
+    keccak256_64_into(np.frombuffer(data, dtype=np.uint8, count=64 * count), count, out)
+    return out.tobytes()
+
+def keccak256_64(data):
+    """Keccak-256 digest of a single 64-byte input"""
+    return keccak256_64_batch(data, 1)
+
+def warm_up():
+    """Trigger JIT compilation (or load the on-disk cache) before timing starts"""
+    keccak256_64_batch(bytes(64), 1)
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Numba JIT SHA-256 for short messages (at most 55 bytes, one block)
+Enough for the Tron double-SHA256 checksum without leaving compiled code
+"""
+import numpy as np
+from numba import njit
+
+K = np.array([
+    0x428a2f98, 0x71374491, 0xb5c0fbcf, 0xe9b5dba5, 0x3956c25b, 0x59f111f1, 0x923f82a4, 0xab1c5ed5,
+    0xd807aa98, 0x12835b01, 0x243185be, 0x550c7dc3, 0x72be5d74, 0x80deb1fe, 0x9bdc06a7, 0xc19bf174,
+    0xe49b69c1, 0xefbe4786, 0x0fc19dc6, 0x240ca1cc, 0x2de92c6f, 0x4a7484aa, 0x5cb0a9dc, 0x76f988da,
+    0x983e5152, 0xa831c66d, 0xb00327c8, 0xbf597fc7, 0xc6e00bf3, 0xd5a79147, 0x06ca6351, 0x14292967,
+    0x27b70a85, 0x2e1b2138, 0x4d2c6dfc, 0x53380d13, 0x650a7354, 0x766a0abb, 0x81c2c92e, 0x92722c85,
+    0xa2bfe8a1, 0xa81a664b, 0xc24b8b70, 0xc76c51a3, 0xd192e819, 0xd6990624, 0xf40e3585, 0x106aa070,
+    0x19a4c116, 0x1e376c08, 0x2748774c, 0x34b0bcb5, 0x391c0cb3, 0x4ed8aa4a, 0x5b9cca4f, 0x682e6ff3,
+    0x748f82ee, 0x78a5636f, 0x84c87814, 0x8cc70208, 0x90befffa, 0xa4506ceb, 0xbef9a3f7, 0xc67178f2,
+], dtype=np.uint64)
+
+H0 = np.array([
+    0x6a09e667, 0xbb67ae85, 0x3c6ef372, 0xa54ff53a, 0x510e527f, 0x9b05688c, 0x1f83d9ab, 0x5be0cd19,
+], dtype=np.uint64)
+
+MASK32 = np.uint64(0xFFFFFFFF)
+
+@njit(cache=True, boundscheck=False, inline='always')
+def rotr(x, n):
+    return ((x >> np.uint64(n)) | (x << np.uint64(32 - n))) & MASK32
+
+@njit(cache=True, boundscheck=False)
+def sha256_short_into(data, length, w, out):
+    """SHA-256 of data[:length] (length <= 55) into the 32 bytes of out; w is 64-word scratch"""
+    # Message schedule from the single padded block
+    for i in range(16):
+        w[i] = 0
+    for i in range(length):
+        w[i >> 2] |= np.uint64(data[i]) << np.uint64(24 - 8 * (i & 3))
+    w[length >> 2] |= np.uint64(0x80) << np.uint64(24 - 8 * (length & 3))
+    w[15] = np.uint64(8 * length)
+    for i in range(16, 64):
+        s0 = rotr(w[i - 15], 7) ^ rotr(w[i - 15], 18) ^ (w[i - 15] >> np.uint64(3))
+        s1 = rotr(w[i - 2], 17) ^ rotr(w[i - 2], 19) ^ (w[i - 2] >> np.uint64(10))
+        w[i] = (w[i - 16] + s0 + w[i - 7] + s1) & MASK32
+
+    a, b, c, d, e, f, g, h = H0[0], H0[1], H0[2], H0[3], H0[4], H0[5], H0[6], H0[7]
+    for i in range(64):
+        t1 = (h + (rotr(e, 6) ^ rotr(e, 11) ^ rotr(e, 25)) + ((e & f) ^ (~e & g & MASK32)) + K[i] + w[i]) & MASK32
+        t2 = ((rotr(a, 2) ^ rotr(a, 13) ^ rotr(a, 22)) + ((a & b) ^ (a & c) ^ (b & c))) & MASK32
+        h = g
+        g = f
+        f = e
+        e = (d + t1) & MASK32
+        d = c
+        c = b
+        b = a
+        a = (t1 + t2) & MASK32
+
+    state = (a, b, c, d, e, f, g, h)
+    for i in range(8):
+        value = (state[i] + H0[i]) & MASK32
+        for k in range(4):
+            out[4 * i + k] = (value >> np.uint64(24 - 8 * k)) & np.uint64(0xFF)
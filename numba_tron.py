@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Numba JIT Tron addresses for batches of 64-byte public keys
+Keccak-256, the double-SHA256 checksum and base58 run fused in one
+compiled loop, so no Python object is created between the stages
+"""
+import numpy as np
+from numba import njit
+
+from numba_keccak import keccak256_64_into
+from numba_sha256 import sha256_short_into
+from numba_base58 import ALPHABET, MAX_ENCODED_LENGTH, TRON_ADDRESS_LENGTH, encode_25_into
+
+# nogil: the kernel touches only arrays, so callers on threads run it in parallel
+@njit(cache=True, boundscheck=False, nogil=True)
+def tron_addresses_into(public_keys, count, alphabet, out):
+    """Addresses of count packed 64-byte public keys into count packed 34-byte addresses"""
+    if public_keys.shape[0] < 64 * count or out.shape[0] < TRON_ADDRESS_LENGTH * count:
+        raise ValueError("Buffers are too small for count public keys")
+
+    digests = np.empty(32 * count, dtype=np.uint8)
+    keccak256_64_into(public_keys, count, digests)
+
+    # Scratch reused for every key: 0x41 + 20 hash bytes + 4 checksum bytes
+    payload = np.empty(25, dtype=np.uint8)
+    payload[0] = 0x41
+    first = np.empty(32, dtype=np.uint8)
+    second = np.empty(32, dtype=np.uint8)
+    schedule = np.empty(64, dtype=np.uint64)
+    digits = np.empty(MAX_ENCODED_LENGTH, dtype=np.uint8)
+
+    for i in range(count):
+        payload[1:21] = digests[i * 32 + 12:i * 32 + 32]
+        sha256_short_into(payload, 21, schedule, first)
+        sha256_short_into(first, 32, schedule, second)
+        payload[21:25] = second[:4]
+
+        pos = encode_25_into(payload, alphabet, digits)
+        if pos != MAX_ENCODED_LENGTH - TRON_ADDRESS_LENGTH:
+            raise ValueError("Payload does not encode to a 34-character Tron address")
+        out[i * TRON_ADDRESS_LENGTH:(i + 1) * TRON_ADDRESS_LENGTH] = digits[pos:]
+
+def tron_addresses(public_keys, count):
+    """ASCII Tron addresses (34 bytes each, packed) of count packed 64-byte public keys"""
+    out = np.empty(TRON_ADDRESS_LENGTH * count, dtype=np.uint8)
+    tron_addresses_into(np.frombuffer(public_keys, dtype=np.uint8, count=64 * count), count, ALPHABET, out)
+    return out.tobytes()
+
+def warm_up():
+    """Trigger JIT compilation (or load the on-disk cache) before workers start"""
+    tron_addresses(bytes(64), 1)
@@ -1,16 +1,17 @@
 #!/usr/bin/env python3
 """
 Optimized Tron Address Generator v3
-Focus on threading + coincurve optimization
+Focus on multiprocessing + coincurve optimization
 Target: 500,000+ addresses per second
 """
 import sys
-import secrets
+import os
 import concurrent.futures
-import threading
+import multiprocessing
 import time
-from queue import Queue
 import hashlib
+from binascii import hexlify
+from tron_utils import SECP256K1_RAW, ALPHABET, derive_public_keys, random_private_keys, base58_25, tron_checksum
 
 # Import the fastest crypto library available
 try:
@@ -26,6 +27,19 @@ except ImportError:
         print("❌ No crypto library available")
         sys.exit(1)
 
+# Optional CUDA k*G for whole batches, opt in with TRON_GEN_GPU=1
+GPU_BACKEND = False
+if os.environ.get("TRON_GEN_GPU") == "1":
+    try:
+        import cuda_secp256k1
+        GPU_BACKEND = cuda_secp256k1.is_available()
+    except ImportError:
+        pass
+    if GPU_BACKEND:
+        print("✅ Using CUDA secp256k1 for public key derivation")
+    else:
+        print("⚠️  TRON_GEN_GPU=1 but numba.cuda/CUDA device unavailable, using CPU")
+
 try:
     from Crypto.Hash import keccak
     KECCAK_LIB = "pycryptodome"
@@ -35,188 +49,221 @@ except ImportError:
     KECCAK_LIB = "hashlib"
     print("⚠️  Using hashlib sha3 (fallback)")
 
-# Optimized constants
-ALPHABET = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+# Batched Keccak-256: a whole batch of public keys per compiled call
+try:
+    import numpy as np
+    from numba_keccak import keccak256_64, keccak256_64_batch, warm_up as warm_up_keccak
+    warm_up_keccak()  # Compile (or load the cache) before any timing starts
+    KECCAK_BATCH = True
+    print("✅ Using numba batched keccak")
+except ImportError:
+    KECCAK_BATCH = False
+
+# Address encoder: JIT-compiled fixed-size encoder if numba is installed
+try:
+    from numba_base58 import base58_encode_25 as encode_address, base58_encode_tron_batch, warm_up
+    warm_up()  # Compile (or load the cache) before any timing starts
+    BASE58_BATCH = True
+except ImportError:
+    encode_address = base58_25
+    BASE58_BATCH = False
+
+def prefix_payload_bounds(prefix):
+    """Inclusive 21-byte payload bounds whose addresses all start with prefix
+
+    Every address is 34 characters, so padding the prefix with the lowest
+    and highest digits brackets the matching 25-byte values. The bounds are
+    tightened so that any 4-byte checksum keeps a payload inside them,
+    which lets keys be rejected before the checksum and base58 are computed.
+    """
+    if not prefix.startswith('T') or len(prefix) > 34 or any(c not in ALPHABET for c in prefix):
+        raise ValueError(f"Invalid Tron address prefix: {prefix}")
+
+    padding = 34 - len(prefix)
+    low = high = 0
+    for char in prefix + '1' * padding:
+        low = low * 58 + ALPHABET.index(char)
+    for char in prefix + 'z' * padding:
+        high = high * 58 + ALPHABET.index(char)
+
+    low = max(-(-low >> 32), 0x41 << 160)
+    high = min(((high + 1) >> 32) - 1, (0x42 << 160) - 1)
+    if low > high:
+        raise ValueError(f"No Tron address payload range matches prefix: {prefix}")
+    return low.to_bytes(21, 'big'), high.to_bytes(21, 'big')
+
+def batch_derive(private_key_buffer, count):
+    """Uncompressed public keys (64 bytes, no 0x04) for count packed private keys"""
+    if GPU_BACKEND:
+        return cuda_secp256k1.derive_public_keys(private_key_buffer, count)
+
+    if SECP256K1_RAW:
+        return derive_public_keys(private_key_buffer, count)
+
+    if CRYPTO_LIB == "coincurve":
+        from_secret = coincurve.PublicKey.from_secret
+        return b''.join([
+            from_secret(private_key_buffer[offset:offset + 32]).format(compressed=False)[1:]
+            for offset in range(0, 32 * count, 32)
+        ])
+
+    return b''.join([
+        SigningKey.from_string(private_key_buffer[offset:offset + 32], curve=SECP256k1).get_verifying_key().to_string()
+        for offset in range(0, 32 * count, 32)
+    ])
 
 class OptimizedGeneratorV3:
-    def __init__(self, num_threads=32):
-        self.num_threads = num_threads
-        self.write_queue = Queue(maxsize=20000)
-        self.stats_lock = threading.Lock()
-        self.total_generated = 0
+    def __init__(self, num_processes=None, prefix=None):
+        # Processes, not threads: the per-key pipeline is CPU-bound under the GIL
+        self.num_processes = num_processes or os.cpu_count()
+        # Vanity search: only keep addresses starting with prefix
+        self.prefix = prefix
+        self.prefix_bounds = prefix_payload_bounds(prefix) if prefix else None
 
     def fast_keccak256(self, data):
         """Fastest keccak implementation"""
+        if KECCAK_BATCH and len(data) == 64:
+            return keccak256_64(data)
         if KECCAK_LIB == "pycryptodome":
-            k = keccak.new(digest_bits=256)
-            k.update(data)
-            return k.digest()
+            return keccak.new(data=data, digest_bits=256).digest()
         else:
             return hashlib.sha3_256(data).digest()
 
-    def optimized_base58_encode(self, data):
-        """Optimized base58 encoding with less overhead"""
-        num = int.from_bytes(data, 'big')
+    def tron_payloads_batch(self, public_keys, count):
+        """21-byte Tron payloads (0x41 + last 20 hash bytes) of count packed public keys, packed"""
+        if KECCAK_BATCH:
+            # Every digest of the batch from one compiled call
+            digests = np.frombuffer(keccak256_64_batch(public_keys, count), dtype=np.uint8).reshape(count, 32)
+            payloads = np.empty((count, 21), dtype=np.uint8)
+            payloads[:, 0] = 0x41
+            payloads[:, 1:] = digests[:, 12:]
+            return payloads.tobytes()
+
+        # bytes slices: pycryptodome takes bytes much faster than memoryviews
+        keccak256 = self.fast_keccak256
+        return b''.join([b'\x41' + keccak256(public_keys[offset:offset + 64])[12:] for offset in range(0, 64 * count, 64)])
+
+    def prefix_filter(self, private_keys, payloads, count):
+        """Keep only the keys whose payload lies in the prefix bounds, both packed"""
+        low, high = self.prefix_bounds
+        matches = [
+            index for index, offset in enumerate(range(0, 21 * count, 21))
+            if low <= payloads[offset:offset + 21] <= high
+        ]
+        return (
+            b''.join([private_keys[index * 32:index * 32 + 32] for index in matches]),
+            b''.join([payloads[index * 21:index * 21 + 21] for index in matches]),
+        )
+
+    def checksum_batch(self, payloads, count):
+        """Packed 4-byte checksums for count packed 21-byte payloads"""
+        tron_payloads = [payloads[offset:offset + 21] for offset in range(0, 21 * count, 21)]
+        return b''.join(map(tron_checksum, tron_payloads))
+
+    def base58_batch(self, payloads, checksums, count):
+        """ASCII addresses, 34 bytes each, for packed payloads and their packed checksums"""
+        if BASE58_BATCH:
+            # Payload and checksum are joined inside the compiled loop, never in Python
+            return base58_encode_tron_batch(payloads, checksums, count)
+
+        encode = encode_address
+        return ''.join([
+            encode(payloads[index * 21:index * 21 + 21] + checksums[index * 4:index * 4 + 4])
+            for index in range(count)
+        ]).encode('ascii')
+
+    def generate_batch_buffers(self, batch_size):
+        """Run the pipeline over whole-batch buffers (structure of arrays)
+
+        Returns the packed private keys (32 bytes each) and ASCII addresses
+        (34 bytes each); each stage is one pass over the whole batch. With a
+        prefix set only the matching keys are checksummed and encoded, so
+        fewer than batch_size may come back.
+        """
+        private_keys = random_private_keys(batch_size)
+        public_keys = batch_derive(private_keys, batch_size)
+        payloads = self.tron_payloads_batch(public_keys, batch_size)
+
+        if self.prefix_bounds:
+            private_keys, payloads = self.prefix_filter(private_keys, payloads, batch_size)
+            batch_size = len(payloads) // 21
+
+        checksums = self.checksum_batch(payloads, batch_size)
+        return private_keys, self.base58_batch(payloads, checksums, batch_size)
+
+    def generate_batch_block(self, batch_size):
+        """Generate a batch as ready-to-write CSV bytes"""
+        private_keys, addresses = self.generate_batch_buffers(batch_size)
+
+        # Hex-encode every private key of the batch in a single call
+        hex_keys = hexlify(private_keys)
+        return b''.join([
+            hex_keys[index * 64:index * 64 + 64] + b',' + addresses[index * 34:index * 34 + 34] + b'\n'
+            for index in range(len(addresses) // 34)
+        ])
+
+    def worker_process_optimized(self, total_count, batch_size):
+        """Worker process - total_count addresses as one block of CSV bytes
+
+        A single bytes object per task keeps the handoff to the parent to
+        one pickled object instead of thousands of tuples.
+        """
+        blocks = []
+        remaining = total_count
+
+        while remaining:
+            size = min(batch_size, remaining)
+            blocks.append(self.generate_batch_block(size))
+            remaining -= size
+
+        return b''.join(blocks)
 
-        if num == 0:
-            return ALPHABET[0]
+    def generate_optimized_v3(self, count, output_file=None):
+        """Generate with a pool of worker processes"""
+        start_time = time.time()
+        print(f"🚀 V3 OPTIMIZED: Generating {count} addresses with {self.num_processes} processes...")
 
-        encoded = []
-        while num > 0:
-            num, remainder = divmod(num, 58)
-            encoded.append(ALPHABET[remainder])
+        # Smaller batches for better responsiveness; the GPU needs big ones
+        batch_size = 65536 if GPU_BACKEND else 200
+        # Each task runs several batches to keep per-task IPC overhead low
+        chunk_size = max(batch_size, 5000)
 
-        # Count leading zeros
-        leading_zeros = 0
-        for byte in data:
-            if byte == 0:
-                leading_zeros += 1
-            else:
-                break
+        chunks = [chunk_size] * (count // chunk_size)
+        if count % chunk_size:
+            chunks.append(count % chunk_size)
 
-        return ALPHABET[0] * leading_zeros + ''.join(reversed(encoded))
+        # A CUDA context does not survive fork, so GPU workers are spawned
+        context = multiprocessing.get_context("spawn") if GPU_BACKEND else None
 
-    def ultra_fast_generation(self, private_key_bytes):
-        """Ultra-optimized address generation"""
+        output = open(output_file, 'wb', buffering=1 << 20) if output_file else None
         try:
-            if CRYPTO_LIB == "coincurve":
-                # Use coincurve - much faster than ecdsa
-                private_key = coincurve.PrivateKey(private_key_bytes)
-                public_key_bytes = private_key.public_key.format(compressed=False)[1:]  # Remove 0x04 prefix
-            else:
-                # Fallback to ecdsa
-                sk = SigningKey.from_string(private_key_bytes, curve=SECP256k1)
-                vk = sk.get_verifying_key()
-                public_key_bytes = vk.to_string()
-
-            # Keccak-256 hash
-            keccak_hash = self.fast_keccak256(public_key_bytes)
-            ethereum_address = keccak_hash[-20:]
-
-            # Tron address
-            tron_address_hex = b'\x41' + ethereum_address
-            checksum = hashlib.sha256(hashlib.sha256(tron_address_hex).digest()).digest()[:4]
-            full_address = tron_address_hex + checksum
-
-            return self.optimized_base58_encode(full_address)
-        except:
-            return None
-
-    def generate_batch_optimized(self, batch_size):
-        """Generate batch with minimal overhead"""
-        results = []
-        for _ in range(batch_size):
-            private_key_bytes = secrets.token_bytes(32)
-            private_key_hex = private_key_bytes.hex()
-            address = self.ultra_fast_generation(private_key_bytes)
-            if address:
-                results.append((private_key_hex, address))
-        return results
-
-    def worker_thread_optimized(self, total_count, batch_size, thread_id):
-        """Optimized worker thread"""
-        generated_count = 0
-
-        while generated_count < total_count:
-            current_batch_size = min(batch_size, total_count - generated_count)
-            batch_results = self.generate_batch_optimized(current_batch_size)
-
-            # Queue results
-            for result in batch_results:
-                self.write_queue.put(result)
-
-            generated_count += current_batch_size
-
-            # Update stats less frequently for performance
-            if generated_count % 500 == 0:
-                with self.stats_lock:
-                    self.total_generated += len(batch_results)
-
-    def writer_thread_optimized(self, output_file, total_target):
-        """Optimized writer thread"""
-        if not output_file:
-            return
-
-        written_count = 0
-        buffer = []
-        buffer_size = 2000
-
-        with open(output_file, 'w') as f:
-            while written_count < total_target:
-                try:
-                    item = self.write_queue.get(timeout=1)
-                    if item is None:
-                        break
-
-                    buffer.append(f"{item[0]},{item[1]}\n")
-                    written_count += 1
-
-                    if len(buffer) >= buffer_size:
-                        f.writelines(buffer)
-                        f.flush()
-                        buffer = []
-
-                    self.write_queue.task_done()
-                except:
-                    continue
-
-            if buffer:
-                f.writelines(buffer)
-                f.flush()
-
-    def generate_optimized_v3(self, count, output_file=None):
-        """Generate with optimized threading"""
-        start_time = time.time()
-        print(f"🚀 V3 OPTIMIZED: Generating {count} addresses with {self.num_threads} threads...")
-
-        addresses_per_thread = count // self.num_threads
-        batch_size = 200  # Smaller batches for better responsiveness
-
-        # Start writer thread
-        writer_future = None
-        if output_file:
-            writer_future = threading.Thread(
-                target=self.writer_thread_optimized,
-                args=(output_file, count)
-            )
-            writer_future.start()
-
-        # Start worker threads
-        with concurrent.futures.ThreadPoolExecutor(max_workers=self.num_threads) as executor:
-            futures = []
-
-            for thread_id in range(self.num_threads):
-                thread_count = addresses_per_thread
-                if thread_id == self.num_threads - 1:
-                    thread_count += count % self.num_threads
-
-                future = executor.submit(
-                    self.worker_thread_optimized,
-                    thread_count,
-                    batch_size,
-                    thread_id
-                )
-                futures.append(future)
-
-            # Monitor progress
-            last_reported = 0
-            while self.total_generated < count:
-                time.sleep(0.1)
-                current = self.total_generated
-
-                if current >= last_reported + 5000:
-                    elapsed = time.time() - start_time
-                    rate = current / elapsed if elapsed > 0 else 0
-                    progress = (current / count) * 100
-                    print(f"  ⚡ {progress:.1f}% | {current} addresses | {rate:.0f}/sec")
-                    last_reported = current
-
-            concurrent.futures.wait(futures)
-
-        # Signal writer to stop
-        if writer_future:
-            self.write_queue.put(None)
-            writer_future.join()
+            with concurrent.futures.ProcessPoolExecutor(max_workers=self.num_processes, mp_context=context) as executor:
+                futures = {
+                    executor.submit(self.worker_process_optimized, chunk, batch_size): chunk
+                    for chunk in chunks
+                }
+
+                # Write and report results as each chunk completes
+                generated = 0
+                matched = 0
+                last_reported = 0
+                for future in concurrent.futures.as_completed(futures):
+                    block = future.result()
+                    generated += futures[future]
+                    matched += block.count(b'\n')
+
+                    if output:
+                        output.write(block)
+
+                    if generated >= last_reported + 5000:
+                        elapsed = time.time() - start_time
+                        rate = generated / elapsed if elapsed > 0 else 0
+                        progress = (generated / count) * 100
+                        print(f"  ⚡ {progress:.1f}% | {generated} addresses | {rate:.0f}/sec")
+                        last_reported = generated
+        finally:
+            if output:
+                output.close()
 
         end_time = time.time()
         elapsed = end_time - start_time
@@ -224,6 +271,8 @@ class OptimizedGeneratorV3:
 
         print(f"✅ COMPLETED: {count} addresses in {elapsed:.2f} seconds")
         print(f"🎯 RATE: {rate:.0f} addresses/second")
+        if self.prefix:
+            print(f"🔍 {matched} addresses start with {self.prefix}")
 
         if rate >= 500000:
             print("🏆 TARGET ACHIEVED: 500k+ addresses/second!")
@@ -236,20 +285,22 @@ class OptimizedGeneratorV3:
 
 def main():
     if len(sys.argv) < 2:
-        print("Usage: python3 optimized_generator_v3.py <count> [output_file] [threads]")
-        print("Example: python3 optimized_generator_v3.py 50000 output.txt 32")
+        print("Usage: python3 optimized_generator_v3.py <count> [output_file] [processes] [prefix]")
+        print("Example: python3 optimized_generator_v3.py 50000 output.txt 8")
+        print("Vanity:  python3 optimized_generator_v3.py 1000000 matches.txt 8 TXyz")
         sys.exit(1)
 
     try:
         count = int(sys.argv[1])
         output_file = sys.argv[2] if len(sys.argv) > 2 else None
-        num_threads = int(sys.argv[3]) if len(sys.argv) > 3 else 32
+        num_processes = int(sys.argv[3]) if len(sys.argv) > 3 else None
+        prefix = sys.argv[4] if len(sys.argv) > 4 else None
 
         if count <= 0 or count > 10000000:
             print("Error: Count must be between 1 and 10,000,000")
             sys.exit(1)
 
-        generator = OptimizedGeneratorV3(num_threads)
+        generator = OptimizedGeneratorV3(num_processes, prefix)
         rate = generator.generate_optimized_v3(count, output_file)
 
     except KeyboardInterrupt:
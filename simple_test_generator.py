@@ -6,7 +6,7 @@ Test coincurve performance vs ecdsa in single threaded mode
 import sys
 import secrets
 import time
-import hashlib
+from tron_utils import base58_25, tron_checksum
 
 # Test both libraries for comparison
 try:
@@ -33,28 +33,6 @@ except ImportError:
     HAS_KECCAK = False
     print("❌ Keccak not available")
 
-ALPHABET = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
-
-def fast_base58_encode(data):
-    """Optimized base58 encoding"""
-    num = int.from_bytes(data, 'big')
-    if num == 0:
-        return ALPHABET[0]
-
-    encoded = []
-    while num > 0:
-        num, remainder = divmod(num, 58)
-        encoded.append(ALPHABET[remainder])
-
-    leading_zeros = 0
-    for byte in data:
-        if byte == 0:
-            leading_zeros += 1
-        else:
-            break
-
-    return ALPHABET[0] * leading_zeros + ''.join(reversed(encoded))
-
 def generate_with_coincurve(private_key_bytes):
     """Generate address using coincurve"""
     if not HAS_COINCURVE or not HAS_KECCAK:
@@ -73,10 +51,9 @@ def generate_with_coincurve(private_key_bytes):
 
         # Tron address
         tron_address_hex = b'\x41' + ethereum_address
-        checksum = hashlib.sha256(hashlib.sha256(tron_address_hex).digest()).digest()[:4]
-        full_address = tron_address_hex + checksum
+        full_address = tron_address_hex + tron_checksum(tron_address_hex)
 
-        return fast_base58_encode(full_address)
+        return base58_25(full_address)
     except Exception as e:
         print(f"Coincurve error: {e}")
         return None
@@ -100,10 +77,9 @@ def generate_with_ecdsa(private_key_bytes):
 
         # Tron address
         tron_address_hex = b'\x41' + ethereum_address
-        checksum = hashlib.sha256(hashlib.sha256(tron_address_hex).digest()).digest()[:4]
-        full_address = tron_address_hex + checksum
+        full_address = tron_address_hex + tron_checksum(tron_address_hex)
 
-        return fast_base58_encode(full_address)
+        return base58_25(full_address)
     except Exception as e:
         print(f"ECDSA error: {e}")
         return None
@@ -1,18 +1,18 @@
 #!/usr/bin/env python3
 """
-Simple 4-Thread Coincurve Test
-Test if threading works with coincurve at all
+Simple 4-Worker Coincurve Test
+Test how coincurve scales across worker processes (threads are GIL-bound)
 """
 import sys
-import secrets
-import threading
+import importlib.util
+import concurrent.futures
 import time
-import hashlib
+from tron_utils import derive_public_key, random_private_keys, base58_25, tron_checksum
 
-try:
-    import coincurve
+# derive_public_key needs coincurve; only check that it is installed here
+if importlib.util.find_spec("coincurve"):
     print("✅ Using coincurve")
-except ImportError:
+else:
     print("❌ Coincurve required")
     sys.exit(1)
 
@@ -23,91 +23,62 @@ except ImportError:
     print("❌ Keccak required")
     sys.exit(1)
 
-ALPHABET = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
-
-# Global results storage
-results = []
-results_lock = threading.Lock()
-
-def fast_base58_encode(data):
-    """Optimized base58 encoding"""
-    num = int.from_bytes(data, 'big')
-    if num == 0:
-        return ALPHABET[0]
-
-    encoded = []
-    while num > 0:
-        num, remainder = divmod(num, 58)
-        encoded.append(ALPHABET[remainder])
-
-    leading_zeros = 0
-    for byte in data:
-        if byte == 0:
-            leading_zeros += 1
-        else:
-            break
-
-    return ALPHABET[0] * leading_zeros + ''.join(reversed(encoded))
+# Address encoder: JIT-compiled fixed-size encoder if numba is installed
+try:
+    from numba_base58 import base58_encode_25 as encode_address, warm_up
+    warm_up()  # Compile (or load the cache) before any timing starts
+except ImportError:
+    encode_address = base58_25
 
 def generate_address(private_key_bytes):
-    """Generate address using coincurve"""
-    try:
-        private_key = coincurve.PrivateKey(private_key_bytes)
-        public_key_bytes = private_key.public_key.format(compressed=False)[1:]
+    """Generate address using coincurve (key must be in [1, n))"""
+    public_key_bytes = derive_public_key(private_key_bytes)
 
-        k = keccak.new(digest_bits=256)
-        k.update(public_key_bytes)
-        keccak_hash = k.digest()
-        ethereum_address = keccak_hash[-20:]
+    k = keccak.new(digest_bits=256)
+    k.update(public_key_bytes)
+    keccak_hash = k.digest()
+    ethereum_address = keccak_hash[-20:]
 
-        tron_address_hex = b'\x41' + ethereum_address
-        checksum = hashlib.sha256(hashlib.sha256(tron_address_hex).digest()).digest()[:4]
-        full_address = tron_address_hex + checksum
+    tron_address_hex = b'\x41' + ethereum_address
+    checksum = tron_checksum(tron_address_hex)
+    full_address = tron_address_hex + checksum
 
-        return fast_base58_encode(full_address)
-    except:
-        return None
+    return encode_address(full_address)
 
-def worker_simple(count_per_thread, thread_id):
-    """Simple worker function"""
+def worker_simple(count_per_worker, worker_id):
+    """Simple worker function, runs in its own process"""
     local_results = []
+    keys = random_private_keys(count_per_worker)
+    # One hex conversion for the whole key buffer instead of one per key
+    hex_keys = keys.hex()
 
-    for i in range(count_per_thread):
-        private_key_bytes = secrets.token_bytes(32)
-        private_key_hex = private_key_bytes.hex()
-        address = generate_address(private_key_bytes)
-
-        if address:
-            local_results.append((private_key_hex, address))
+    for offset in range(0, 32 * count_per_worker, 32):
+        address = generate_address(keys[offset:offset + 32])
+        local_results.append((hex_keys[2 * offset:2 * offset + 64], address))
 
-    # Add to global results
-    with results_lock:
-        results.extend(local_results)
-        print(f"Thread {thread_id} completed: {len(local_results)} addresses")
+    print(f"Worker {worker_id} completed: {len(local_results)} addresses")
+    return local_results
 
 def test_simple_threading(total_count):
-    """Test with 4 simple threads"""
-    print(f"🧪 Testing {total_count} addresses with 4 threads...")
+    """Test with 4 simple worker processes"""
+    print(f"🧪 Testing {total_count} addresses with 4 processes...")
 
-    global results
     results = []
-
-    threads = []
-    count_per_thread = total_count // 4
+    count_per_worker = total_count // 4
 
     start_time = time.time()
 
-    # Start 4 threads
-    for i in range(4):
-        thread = threading.Thread(target=worker_simple, args=(count_per_thread, i))
-        threads.append(thread)
-        thread.start()
-        print(f"Started thread {i}")
+    # Start 4 worker processes
+    with concurrent.futures.ProcessPoolExecutor(max_workers=4) as executor:
+        futures = []
+        for i in range(4):
+            futures.append(executor.submit(worker_simple, count_per_worker, i))
+            print(f"Started worker {i}")
 
-    # Wait for all threads
-    for i, thread in enumerate(threads):
-        thread.join()
-        print(f"Thread {i} finished")
+        # Wait for all workers
+        for i, future in enumerate(futures):
+            results.extend(future.result())
+            print(f"Worker {i} finished")
 
     end_time = time.time()
     elapsed = end_time - start_time
@@ -134,9 +105,9 @@ def main():
         rate = test_simple_threading(count)
 
         if rate >= 100000:
-            print("🔥 Great! Threading is working well")
+            print("🔥 Great! Worker processes are scaling well")
         else:
-            print("⚠️ Threading efficiency needs improvement")
+            print("⚠️ Parallel efficiency needs improvement")
 
     except KeyboardInterrupt:
         print("\n❌ Test interrupted")
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+CUDA secp256k1 field arithmetic and public key kernel checked against
+Python big ints and coincurve
+The checks run in a child process on numba's CUDA simulator, which has to
+be selected before numba.cuda is first imported; run with
+NUMBA_ENABLE_CUDASIM=0 to check a real device instead
+"""
+import os
+import sys
+import subprocess
+
+import pytest
+
+P = 2**256 - 2**32 - 977
+N = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141
+
+def check_field_arithmetic():
+    import numpy as np
+    from numba import cuda
+    import cuda_secp256k1
+
+    @cuda.jit
+    def field_ops(a, b, out):
+        """out[i] = a + b, a - b and a * b for every row, on one thread"""
+        for index in range(a.shape[0]):
+            cuda_secp256k1.fe_add(out[index, 0], a[index], b[index])
+            cuda_secp256k1.fe_sub(out[index, 1], a[index], b[index])
+            cuda_secp256k1.fe_mul(out[index, 2], a[index], b[index])
+
+    @cuda.jit
+    def field_inv(a, out):
+        """out[i] = 1 / a[i], on one thread"""
+        for index in range(a.shape[0]):
+            cuda_secp256k1.fe_inv(out[index], a[index])
+
+    def to_limbs(value):
+        return [(value >> (32 * i)) & 0xFFFFFFFF for i in range(8)]
+
+    def from_limbs(limbs):
+        return sum(int(limb) << (32 * i) for i, limb in enumerate(limbs))
+
+    # Carries across every limb, values next to p and the 2^256 fold
+    edges = [1, 2, 977, 2**32, 2**32 + 977, 2**224, 2**255, P - 1, P - 2, P - 2**32, 2**256 - 2**33 - 1]
+    pairs = [(a, b) for a in edges for b in edges + [0]]
+    pairs += [(int.from_bytes(os.urandom(32), 'big') % (P - 1) + 1, int.from_bytes(os.urandom(32), 'big') % P) for _ in range(32)]
+
+    a = np.array([to_limbs(x) for x, _ in pairs], dtype=np.uint64)
+    b = np.array([to_limbs(y) for _, y in pairs], dtype=np.uint64)
+    out = np.zeros((len(pairs), 3, 8), dtype=np.uint64)
+    field_ops[1, 1](a, b, out)
+
+    for (x, y), row in zip(pairs, out):
+        assert from_limbs(row[0]) == (x + y) % P, ("add", x, y)
+        assert from_limbs(row[1]) == (x - y) % P, ("sub", x, y)
+        assert from_limbs(row[2]) == x * y % P, ("mul", x, y)
+
+    # Inversion is 256 squarings each, so only the edges and a few random values
+    values = edges + [int.from_bytes(os.urandom(32), 'big') % (P - 1) + 1 for _ in range(4)]
+    inverses = np.zeros((len(values), 8), dtype=np.uint64)
+    field_inv[1, 1](np.array([to_limbs(x) for x in values], dtype=np.uint64), inverses)
+    for x, row in zip(values, inverses):
+        assert from_limbs(row) == pow(x, -1, P), ("inv", x)
+
+def check_public_keys():
+    import coincurve
+    import cuda_secp256k1
+
+    # One-byte keys, a window boundary, the top bit and keys next to n
+    values = [1, 2, 255, 256, 257, 2**255, N - 2, N - 1]
+    values += [int.from_bytes(os.urandom(32), 'big') % (N - 1) + 1 for _ in range(24)]
+    keys = [value.to_bytes(32, 'big') for value in values]
+
+    public_keys = cuda_secp256k1.derive_public_keys(b''.join(keys), len(keys))
+    for index, key in enumerate(keys):
+        expected = coincurve.PublicKey.from_secret(key).format(compressed=False)[1:]
+        assert public_keys[index * 64:index * 64 + 64] == expected, key.hex()
+
+def test_cuda_kernels():
+    pytest.importorskip("numba")
+    env = dict(os.environ)
+    env.setdefault("NUMBA_ENABLE_CUDASIM", "1")
+    result = subprocess.run(
+        [sys.executable, os.path.abspath(__file__)],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        env=env, capture_output=True, text=True, timeout=600,
+    )
+    assert result.returncode == 0, result.stdout + result.stderr
+
+if __name__ == "__main__":
+    check_field_arithmetic()
+    check_public_keys()
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Numba 25-byte base58 encoder checked against textbook big-int base58
+"""
+import os
+
+import pytest
+
+pytest.importorskip("numba")
+
+import numba_base58
+
+ALPHABET = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+
+def base58_encode(data):
+    """Textbook big-int base58, one '1' per leading zero byte"""
+    num = int.from_bytes(data, 'big')
+    digits = ''
+    while num:
+        num, remainder = divmod(num, 58)
+        digits = ALPHABET[remainder] + digits
+    return '1' * (len(data) - len(data.lstrip(b'\x00'))) + digits
+
+def tron_payload(body=None):
+    """0x41 + 24 bytes, random unless given"""
+    return b'\x41' + (os.urandom(24) if body is None else body)
+
+def test_base58_encode_25_matches_big_int():
+    payloads = [bytes(25), b'\x00' * 24 + b'\x01', b'\x00\x00' + b'\xff' * 23, b'\xff' * 25]
+    payloads += [tron_payload(bytes(24)), tron_payload(b'\xff' * 24), tron_payload(bytes(range(24)))]
+    payloads += [tron_payload() for _ in range(500)] + [os.urandom(25) for _ in range(500)]
+    for data in payloads:
+        assert numba_base58.base58_encode_25(data) == base58_encode(data)
+        assert numba_base58.base58_encode_25_bytes(data) == base58_encode(data).encode('ascii')
+
+def test_base58_batches_match_single_encoder():
+    count = 300
+    payloads = [tron_payload() for _ in range(count - 2)] + [tron_payload(bytes(24)), tron_payload(b'\xff' * 24)]
+    expected = b''.join(base58_encode(payload).encode('ascii') for payload in payloads)
+    assert numba_base58.base58_encode_25_batch(b''.join(payloads), count) == expected
+    assert numba_base58.base58_encode_tron_batch(
+        b''.join(payload[:21] for payload in payloads),
+        b''.join(payload[21:] for payload in payloads),
+        count,
+    ) == expected
+
+def test_base58_batch_rejects_short_address():
+    # A zero payload does not encode to 34 digits, so it is not a Tron address
+    with pytest.raises(ValueError):
+        numba_base58.base58_encode_25_batch(bytes(25), 1)
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Numba single-block SHA-256 and the fused Tron address kernel checked
+against hashlib and the reference address code
+"""
+import os
+import hashlib
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("numba")
+
+import coincurve
+
+import numba_sha256
+import numba_tron
+from gen_tron_address_real import private_key_to_tron_address
+
+SECP256K1_N = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141
+
+@pytest.mark.parametrize("length", range(56))
+def test_sha256_short_matches_hashlib(length):
+    w = np.empty(64, dtype=np.uint64)
+    out = np.empty(32, dtype=np.uint8)
+    inputs = [bytes(length), b'\xff' * length, bytes(range(length))] + [os.urandom(length) for _ in range(20)]
+    for data in inputs:
+        numba_sha256.sha256_short_into(np.frombuffer(data, dtype=np.uint8), length, w, out)
+        assert out.tobytes() == hashlib.sha256(data).digest()
+
+def test_tron_addresses_match_reference():
+    secrets = [(1).to_bytes(32, 'big'), (SECP256K1_N - 1).to_bytes(32, 'big')] + [os.urandom(32) for _ in range(200)]
+    public_keys = b''.join(coincurve.PublicKey.from_secret(secret).format(compressed=False)[1:] for secret in secrets)
+
+    addresses = numba_tron.tron_addresses(public_keys, len(secrets))
+    for index, secret in enumerate(secrets):
+        assert addresses[index * 34:index * 34 + 34].decode('ascii') == private_key_to_tron_address(secret.hex())
+
+def test_tron_addresses_into_rejects_short_buffers():
+    public_keys = np.frombuffer(os.urandom(128), dtype=np.uint8)
+    with pytest.raises(ValueError):
+        numba_tron.tron_addresses_into(public_keys, 2, numba_tron.ALPHABET, np.empty(34, dtype=np.uint8))
+    with pytest.raises(ValueError):
+        numba_tron.tron_addresses_into(public_keys, 3, numba_tron.ALPHABET, np.empty(34 * 3, dtype=np.uint8))
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Vanity prefix payload bounds of optimized_generator_v3 checked by encoding
+the edge payloads with every extreme checksum
+"""
+import os
+
+import pytest
+
+from optimized_generator_v3 import OptimizedGeneratorV3, prefix_payload_bounds
+from gen_tron_address_real import private_key_to_tron_address
+from tron_utils import base58_25
+
+CHECKSUMS = [b'\x00' * 4, b'\xff' * 4]
+
+@pytest.mark.parametrize("prefix", ["A", "TO", "T0", "T" + "1" * 34, "T1", "Tz", "TZZZ"])
+def test_invalid_or_unreachable_prefix_raises(prefix):
+    with pytest.raises(ValueError):
+        prefix_payload_bounds(prefix)
+
+@pytest.mark.parametrize("prefix", ["T", "T9", "TA", "TR", "TX", "TZ", "TXYZ", "TTTTTT"])
+def test_bound_payloads_match_prefix(prefix):
+    low, high = prefix_payload_bounds(prefix)
+    assert len(low) == len(high) == 21
+    assert low[0] == high[0] == 0x41
+    assert low <= high
+
+    low_value = int.from_bytes(low, 'big')
+    span = int.from_bytes(high, 'big') - low_value
+    inside = [low, high] + [(low_value + int.from_bytes(os.urandom(21), 'big') % (span + 1)).to_bytes(21, 'big') for _ in range(100)]
+    for payload in inside:
+        for checksum in CHECKSUMS + [os.urandom(4)]:
+            assert base58_25(payload + checksum).startswith(prefix)
+
+def test_prefix_batches_only_return_matching_addresses():
+    generator = OptimizedGeneratorV3(1, prefix="TR")
+    private_keys, addresses = generator.generate_batch_buffers(2000)
+    assert len(private_keys) // 32 == len(addresses) // 34
+    for index in range(len(addresses) // 34):
+        address = addresses[index * 34:index * 34 + 34].decode('ascii')
+        assert address.startswith("TR")
+        assert address == private_key_to_tron_address(private_keys[index * 32:index * 32 + 32].hex())
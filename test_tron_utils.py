@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Shared helpers in tron_utils checked against hashlib, coincurve and
+textbook big-int base58
+"""
+import os
+import hashlib
+
+import coincurve
+import pytest
+
+import tron_utils
+from tron_utils import (
+    ALPHABET, SECP256K1_N, base58_25, base58_25_bytes, derive_public_key, derive_public_keys, random_private_keys,
+    tron_checksum,
+)
+
+def test_random_private_keys_in_range():
+    keys = random_private_keys(1000)
+    assert len(keys) == 32 * 1000
+    for offset in range(0, len(keys), 32):
+        assert 0 < int.from_bytes(keys[offset:offset + 32], 'big') < SECP256K1_N
+
+def test_random_private_keys_redraws_out_of_range(monkeypatch):
+    # Zero key, key == N and a key above N in one batch, then real randomness
+    draws = [bytes(32) + SECP256K1_N.to_bytes(32, 'big') + b'\xff' * 32 + b'\x01' * 32]
+    urandom = os.urandom
+    monkeypatch.setattr(tron_utils.os, 'urandom', lambda size: draws.pop(0) if draws else urandom(size))
+
+    keys = random_private_keys(4)
+    assert keys[96:] == b'\x01' * 32
+    for offset in range(0, len(keys), 32):
+        assert 0 < int.from_bytes(keys[offset:offset + 32], 'big') < SECP256K1_N
+
+def test_tron_checksum_is_double_sha256():
+    for payload in [bytes(21), b'\x41' + b'\xff' * 20] + [b'\x41' + os.urandom(20) for _ in range(100)]:
+        assert tron_checksum(payload) == hashlib.sha256(hashlib.sha256(payload).digest()).digest()[:4]
+
+def test_base58_25_matches_big_int():
+    payloads = [b'\x41' + bytes(24), b'\x41' + b'\xff' * 24] + [b'\x41' + os.urandom(24) for _ in range(1000)]
+    for payload in payloads:
+        num = int.from_bytes(payload, 'big')
+        expected = ''
+        while num:
+            num, remainder = divmod(num, 58)
+            expected = ALPHABET[remainder] + expected
+        assert base58_25(payload) == expected
+        assert base58_25_bytes(payload) == expected.encode('ascii')
+
+def test_derive_public_key_matches_coincurve():
+    secrets = [(1).to_bytes(32, 'big'), (SECP256K1_N - 1).to_bytes(32, 'big')] + [os.urandom(32) for _ in range(100)]
+    for secret in secrets:
+        assert derive_public_key(secret) == coincurve.PublicKey.from_secret(secret).format(compressed=False)[1:]
+
+def test_derive_public_keys_matches_single_key():
+    keys = random_private_keys(257)
+    public_keys = derive_public_keys(keys, 257)
+    assert len(public_keys) == 64 * 257
+    for index in range(257):
+        assert public_keys[index * 64:index * 64 + 64] == derive_public_key(keys[index * 32:index * 32 + 32])
+
+@pytest.mark.parametrize("secret", [bytes(32), SECP256K1_N.to_bytes(32, 'big')])
+def test_derive_public_key_rejects_invalid_key(secret):
+    with pytest.raises(ValueError):
+        derive_public_key(secret)
+    with pytest.raises(ValueError):
+        derive_public_keys(os.urandom(32) + secret, 2)
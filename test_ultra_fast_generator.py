@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+ultra_fast_generator's writer hand-off: output checked against the
+reference address code, failing workers and the pending-batch bound
+"""
+import time
+from collections import deque
+
+import pytest
+
+import ultra_fast_generator
+from ultra_fast_generator import HighPerformanceGenerator
+from gen_tron_address_real import private_key_to_tron_address
+
+class FailingGenerator(HighPerformanceGenerator):
+    def generate_batch(self, batch_size):
+        if batch_size != ultra_fast_generator.TASK_SIZE:
+            raise RuntimeError("worker failed")
+        return super().generate_batch(batch_size)
+
+class SlowWriterGenerator(HighPerformanceGenerator):
+    def write_all(self, fd, data):
+        time.sleep(0.1)
+        super().write_all(fd, data)
+
+def read_lines(path):
+    with open(path) as f:
+        return [line.rstrip('\n').split(',') for line in f]
+
+def test_output_matches_reference(tmp_path):
+    output = tmp_path / "addresses.csv"
+    HighPerformanceGenerator(2).generate_ultra_fast(2500, str(output))
+
+    lines = read_lines(output)
+    assert len(lines) == 2500
+    for private_key, address in lines[:200]:
+        assert address == private_key_to_tron_address(private_key)
+
+def test_worker_error_reaches_caller(tmp_path):
+    # The last task is short and raises; the writer must still be stopped
+    with pytest.raises(RuntimeError):
+        FailingGenerator(2).generate_ultra_fast(2500, str(tmp_path / "addresses.csv"))
+
+def test_pending_batches_stay_bounded(tmp_path, monkeypatch):
+    peak = [0]
+
+    class TrackedDeque(deque):
+        def append(self, item):
+            super().append(item)
+            peak[0] = max(peak[0], len(self))
+
+    monkeypatch.setattr(ultra_fast_generator, 'deque', TrackedDeque)
+    monkeypatch.setattr(ultra_fast_generator, 'WRITE_CHUNK', 1)  # One slow write per batch
+
+    output = tmp_path / "addresses.csv"
+    count = 30 * ultra_fast_generator.TASK_SIZE
+    SlowWriterGenerator(2).generate_ultra_fast(count, str(output))
+
+    assert len(read_lines(output)) == count
+    assert peak[0] <= ultra_fast_generator.MAX_PENDING_BATCHES + 1  # + the poison pill
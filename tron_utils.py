@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Helpers shared by the Tron address generators
+Private key sampling, public key derivation, the address checksum and
+the fixed-size base58 fallback used when the numba kernels are not installed
+"""
+import os
+import hashlib
+
+SECP256K1_N = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141
+
+def random_private_keys(count):
+    """count valid secp256k1 private keys drawn as one contiguous buffer
+
+    One os.urandom call per batch instead of a getrandom syscall per key.
+    """
+    buffer = os.urandom(32 * count)
+
+    # A key outside [1, N) starts with 15 0xff bytes or is all zero, so one
+    # scan of the whole buffer rules both out; hits get the exact check
+    if b'\xff' * 15 in buffer or b'\x00' * 32 in buffer:
+        buffer = bytearray(buffer)
+        for offset in range(0, 32 * count, 32):
+            while not 0 < int.from_bytes(buffer[offset:offset + 32], 'big') < SECP256K1_N:
+                buffer[offset:offset + 32] = os.urandom(32)
+        buffer = bytes(buffer)
+
+    return buffer
+
+# Raw libsecp256k1 bindings bundled with coincurve (skip the Python wrappers)
+try:
+    from coincurve._libsecp256k1 import ffi, lib
+    from coincurve.context import GLOBAL_CONTEXT
+    from coincurve.flags import EC_UNCOMPRESSED
+    SECP256K1_RAW = True
+except ImportError:
+    SECP256K1_RAW = False
+
+if SECP256K1_RAW:
+    # Output buffers reused by every call in this process
+    _pubkey = ffi.new('secp256k1_pubkey *')
+    _serialized = ffi.new('unsigned char[65]')
+    _serialized_len = ffi.new('size_t *')
+
+    def derive_public_key(private_key_bytes, _create=lib.secp256k1_ec_pubkey_create,
+                          _serialize=lib.secp256k1_ec_pubkey_serialize):
+        """Uncompressed public key (64 bytes, no 0x04) for a 32-byte private key"""
+        if not _create(GLOBAL_CONTEXT.ctx, _pubkey, private_key_bytes):
+            raise ValueError("Invalid private key")
+        _serialized_len[0] = 65
+        _serialize(GLOBAL_CONTEXT.ctx, _serialized, _serialized_len, _pubkey, EC_UNCOMPRESSED)
+        return ffi.buffer(_serialized)[1:]
+
+    def derive_public_keys(private_key_buffer, count):
+        """Public keys for count packed private keys, packed 64 bytes each"""
+        # One C array per batch, no Python key objects per iteration
+        ctx = GLOBAL_CONTEXT.ctx
+        pubkeys = ffi.new('secp256k1_pubkey[]', count)
+        output = ffi.new('unsigned char[]', 65 * count)
+        output_len = ffi.new('size_t *')
+        keys = ffi.from_buffer('unsigned char[]', private_key_buffer)  # No per-key copies
+        pubkey_create = lib.secp256k1_ec_pubkey_create
+        pubkey_serialize = lib.secp256k1_ec_pubkey_serialize
+
+        for index in range(count):
+            if not pubkey_create(ctx, pubkeys + index, keys + index * 32):
+                raise ValueError("Invalid private key")
+            output_len[0] = 65
+            pubkey_serialize(ctx, output + index * 65, output_len, pubkeys + index, EC_UNCOMPRESSED)
+
+        serialized = memoryview(ffi.buffer(output))
+        return b''.join([serialized[offset + 1:offset + 65] for offset in range(0, 65 * count, 65)])
+else:
+    def derive_public_key(private_key_bytes):
+        """Uncompressed public key (64 bytes, no 0x04) for a 32-byte private key"""
+        from coincurve import PublicKey  # Raises ImportError without coincurve
+        return PublicKey.from_secret(private_key_bytes).format(compressed=False)[1:]
+
+    def derive_public_keys(private_key_buffer, count):
+        """Public keys for count packed private keys, packed 64 bytes each"""
+        return b''.join([derive_public_key(private_key_buffer[offset:offset + 32]) for offset in range(0, 32 * count, 32)])
+
+def tron_checksum(payload, _sha256=hashlib.sha256):
+    """First 4 bytes of double SHA256 over the 21-byte Tron payload"""
+    return _sha256(_sha256(payload).digest()).digest()[:4]
+
+ALPHABET = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+
+# 58^5 < 2^30 fits in a single CPython int digit, so each big-int divmod
+# yields five base58 digits that are then split with small-int math
+BASE58_CHUNK = 58 ** 5
+BASE58_PAIRS = [a + b for a in ALPHABET for b in ALPHABET]
+
+def base58_25(data):
+    """Base58 for a 25-byte Tron payload (0x41 prefix), always 34 characters
+
+    A 0x41-prefixed payload is below 58^34, so it fits in exactly seven
+    5-digit chunks whose top digit is always '1' and is dropped.
+    """
+    num = int.from_bytes(data, 'big')
+    pairs = BASE58_PAIRS
+    alphabet = ALPHABET
+
+    num, c6 = divmod(num, BASE58_CHUNK)
+    num, c5 = divmod(num, BASE58_CHUNK)
+    num, c4 = divmod(num, BASE58_CHUNK)
+    num, c3 = divmod(num, BASE58_CHUNK)
+    num, c2 = divmod(num, BASE58_CHUNK)
+    c0, c1 = divmod(num, BASE58_CHUNK)
+
+    encoded = []
+    for chunk in (c0, c1, c2, c3, c4, c5, c6):
+        chunk, low = divmod(chunk, 3364)
+        high, mid = divmod(chunk, 3364)
+        encoded += (alphabet[high], pairs[mid], pairs[low])
+
+    return ''.join(encoded)[1:]
+
+def base58_25_bytes(data):
+    """base58_25 as ASCII bytes"""
+    return base58_25(data).encode('ascii')
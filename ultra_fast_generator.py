@@ -2,198 +2,276 @@
 """
 Ultra High Performance Tron Address Generator
 Target: 500,000 addresses per second
-Uses multi-threading and optimized crypto operations
+Uses worker processes and optimized crypto operations
 """
 import sys
-import secrets
+import os
 import concurrent.futures
+import multiprocessing
 import threading
 import time
-from queue import Queue
-from ecdsa import SigningKey, SECP256k1
+from collections import deque
 from Crypto.Hash import keccak
-import hashlib
+from binascii import hexlify
+from tron_utils import SECP256K1_RAW, derive_public_key as secp256k1_public_key, random_private_keys, base58_25_bytes, tron_checksum
+
+# libsecp256k1 through coincurve if available, pure-Python ecdsa otherwise
+try:
+    import coincurve
+    public_key_from_secret = coincurve.PublicKey.from_secret
+    CRYPTO_LIB = "coincurve"
+except ImportError:
+    from ecdsa import SigningKey, SECP256k1
+    CRYPTO_LIB = "ecdsa"
+
+# Keccak, checksum and base58 of a whole batch fused in one compiled loop
+try:
+    from numba_tron import tron_addresses, warm_up as warm_up_tron
+    warm_up_tron()  # Compile (or load the cache) before workers fork
+    FUSED_TAIL = True
+except ImportError:
+    FUSED_TAIL = False
+
+# Without the fused kernel: Keccak-256 of a whole batch in one compiled call
+KECCAK_BATCH = False
+if not FUSED_TAIL:
+    try:
+        from numba_keccak import keccak256_64_batch, warm_up as warm_up_keccak
+        warm_up_keccak()
+        KECCAK_BATCH = True
+    except ImportError:
+        pass
+
+# 25-byte payloads: native 64-bit limb division instead of big-int divmod
+encode_address = base58_25_bytes
+if not FUSED_TAIL:
+    try:
+        from numba_base58 import base58_encode_25_bytes, warm_up as warm_up_base58
+        warm_up_base58()
+        encode_address = base58_encode_25_bytes
+    except ImportError:
+        pass
+
+# Addresses per worker task: large enough to amortize the IPC round trip
+TASK_SIZE = 1000
+
+# Bytes the writer accumulates before each write syscall
+WRITE_CHUNK = 1 << 20
+
+# Batches handed to the writer but not yet taken (10,000 addresses, the
+# bound the old write Queue had), and tasks kept submitted per worker;
+# together they cap how far generation can run ahead of a slow disk
+MAX_PENDING_BATCHES = 10
+TASKS_IN_FLIGHT_PER_WORKER = 2
+
+def allowed_cpus():
+    """CPU ids this process may run on, sorted; empty where affinity is unsupported"""
+    if not hasattr(os, 'sched_getaffinity'):
+        return []
+    return sorted(os.sched_getaffinity(0))
+
+def pin_to_cpu(cpu):
+    """Pin the calling process (or thread, on Linux) to one CPU"""
+    try:
+        os.sched_setaffinity(0, {cpu})
+    except OSError:
+        pass  # Keep the inherited affinity
 
-# Global constants for optimization
-ALPHABET = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
-ALPHABET_BYTES = ALPHABET.encode('ascii')
+def _init_worker(cpus, next_cpu):
+    """Pool initializer: pin each worker process to its own CPU, round-robin"""
+    with next_cpu.get_lock():
+        slot = next_cpu.value
+        next_cpu.value += 1
+    pin_to_cpu(cpus[slot % len(cpus)])
 
 class HighPerformanceGenerator:
-    def __init__(self, num_threads=20):
-        self.num_threads = num_threads
-        self.write_queue = Queue(maxsize=10000)
-        self.stats_lock = threading.Lock()
-        self.total_generated = 0
-
-    def fast_base58_encode(self, data):
-        """Optimized base58 encoding"""
-        # Convert bytes to integer
-        num = int.from_bytes(data, 'big')
-
-        if num == 0:
-            return ALPHABET[0]
-
-        # Convert to base58
-        encoded = []
-        while num > 0:
-            num, remainder = divmod(num, 58)
-            encoded.append(ALPHABET[remainder])
-
-        # Handle leading zeros
-        for byte in data:
-            if byte == 0:
-                encoded.append(ALPHABET[0])
-            else:
-                break
-
-        return ''.join(reversed(encoded))
-
-    def fast_private_key_to_address(self, private_key_bytes):
-        """Optimized address generation"""
-        try:
-            # Generate public key using secp256k1
-            sk = SigningKey.from_string(private_key_bytes, curve=SECP256k1)
-            vk = sk.get_verifying_key()
-            public_key_bytes = vk.to_string()
-
-            # Keccak-256 hash
-            k = keccak.new(digest_bits=256)
-            k.update(public_key_bytes)
-            keccak_hash = k.digest()
-            ethereum_address = keccak_hash[-20:]
-
-            # Tron address
-            tron_address_hex = b'\x41' + ethereum_address
-            checksum = hashlib.sha256(hashlib.sha256(tron_address_hex).digest()).digest()[:4]
-            full_address = tron_address_hex + checksum
-
-            return self.fast_base58_encode(full_address)
-        except:
-            return None
-
-    def generate_batch(self, batch_size):
-        """Generate a batch of addresses in one thread"""
-        results = []
-
-        for _ in range(batch_size):
-            # Generate random private key
-            private_key_bytes = secrets.token_bytes(32)
-            private_key_hex = private_key_bytes.hex()
-
-            # Generate address
-            address = self.fast_private_key_to_address(private_key_bytes)
-
-            if address:
-                results.append((private_key_hex, address))
+    def __init__(self, num_processes=None):
+        # The first CPU is reserved for the writer and workers share the rest;
+        # with a single CPU nothing is pinned
+        cpus = allowed_cpus()
+        if len(cpus) > 1:
+            self.writer_cpu, self.worker_cpus = cpus[0], cpus[1:]
+        else:
+            self.writer_cpu, self.worker_cpus = None, []
 
-        return results
+        # Processes, not threads: the Python-side glue holds the GIL
+        self.num_processes = num_processes or len(self.worker_cpus) or os.cpu_count()
 
-    def worker_thread(self, total_count, batch_size, thread_id):
-        """Worker thread for generating addresses"""
-        generated_count = 0
+    def derive_public_key(self, private_key_bytes):
+        """Uncompressed public key (64 bytes, no 0x04) for a 32-byte private key"""
+        if SECP256K1_RAW:
+            return secp256k1_public_key(private_key_bytes)
+        if CRYPTO_LIB == "coincurve":
+            return public_key_from_secret(private_key_bytes).format(compressed=False)[1:]
+        sk = SigningKey.from_string(private_key_bytes, curve=SECP256k1)
+        return sk.get_verifying_key().to_string()
 
-        while generated_count < total_count:
-            current_batch_size = min(batch_size, total_count - generated_count)
-            batch_results = self.generate_batch(current_batch_size)
+    def tron_address(self, ethereum_address):
+        """Base58 Tron address (ASCII bytes) for the last 20 bytes of a public key hash"""
+        tron_address_hex = b'\x41' + ethereum_address
+        full_address = tron_address_hex + tron_checksum(tron_address_hex)
 
-            # Add to write queue
-            for result in batch_results:
-                self.write_queue.put(result)
+        return encode_address(full_address)
 
-            generated_count += current_batch_size
+    def generate_batch(self, batch_size):
+        """Generate a batch of addresses in one worker
+
+        Returns the packed private keys and packed 34-byte addresses; the
+        writer hex-encodes the keys, so workers only do the EC and hash work
+        and the parent unpickles two bytes objects per batch.
+        """
+        private_key_buffer = random_private_keys(batch_size)
+        private_keys = [private_key_buffer[offset:offset + 32] for offset in range(0, 32 * batch_size, 32)]
+
+        # Hot-loop callables bound to locals, no per-key method dispatch
+        if SECP256K1_RAW:
+            public_keys = b''.join(map(secp256k1_public_key, private_keys))
+        elif CRYPTO_LIB == "coincurve":
+            from_secret = public_key_from_secret
+            public_keys = b''.join([from_secret(key).format(compressed=False)[1:] for key in private_keys])
+        else:
+            public_keys = b''.join(map(self.derive_public_key, private_keys))
 
-            # Update stats
-            with self.stats_lock:
-                self.total_generated += len(batch_results)
+        if FUSED_TAIL:
+            # Everything after k*G in one call, addresses packed 34 bytes each
+            return private_key_buffer, tron_addresses(public_keys, batch_size)
 
-    def writer_thread(self, output_file, total_target):
-        """Writer thread for file output"""
+        # Hash every public key of the batch, then build the addresses
+        if KECCAK_BATCH:
+            digests = keccak256_64_batch(public_keys, batch_size)
+            ethereum_addresses = [digests[offset + 12:offset + 32] for offset in range(0, 32 * batch_size, 32)]
+        else:
+            keccak_new = keccak.new
+            ethereum_addresses = [
+                keccak_new(data=public_keys[offset:offset + 64], digest_bits=256).digest()[12:]
+                for offset in range(0, 64 * batch_size, 64)
+            ]
+
+        return private_key_buffer, b''.join(map(self.tron_address, ethereum_addresses))
+
+    def write_all(self, fd, data):
+        """os.write until every byte of data is written"""
+        with memoryview(data) as view:
+            while view:
+                view = view[os.write(fd, view):]
+
+    def ordered_results(self, executor, tasks):
+        """generate_batch results in task order, with a bounded number of tasks submitted
+
+        executor.map submits every task up front and keeps each finished
+        result until it is consumed, so it cannot apply back-pressure.
+        """
+        in_flight = deque()
+        limit = TASKS_IN_FLIGHT_PER_WORKER * self.num_processes
+        for task in tasks:
+            in_flight.append(executor.submit(self.generate_batch, task))
+            if len(in_flight) >= limit:
+                yield in_flight.popleft().result()
+        while in_flight:
+            yield in_flight.popleft().result()
+
+    def writer_thread(self, pending, new_data, room, output_file, total_target):
+        """Writer thread for file output, draining batches from the pending deque
+
+        Every batch taken frees one slot of the room semaphore the parent
+        acquires before handing over a batch.
+        """
         written_count = 0
-        buffer = []
-        buffer_size = 1000  # Write in batches
-
-        with open(output_file, 'w') as f:
-            while written_count < total_target:
-                try:
-                    # Get item from queue
-                    item = self.write_queue.get(timeout=1)
-                    if item is None:  # Poison pill
-                        break
-
-                    buffer.append(f"{item[0]},{item[1]}\n")
-                    written_count += 1
-
-                    # Write buffer when full
-                    if len(buffer) >= buffer_size:
-                        f.writelines(buffer)
-                        f.flush()
-                        buffer = []
-
-                    self.write_queue.task_done()
-
-                except:
-                    continue
-
-            # Write remaining buffer
-            if buffer:
-                f.writelines(buffer)
-                f.flush()
+        buffer = bytearray()
+        stopped = False
+        if self.writer_cpu is not None:
+            pin_to_cpu(self.writer_cpu)  # Mostly syscalls; keep it off the worker CPUs
+
+        # Unbuffered file: the bytearray is the only buffer, written in large chunks
+        with open(output_file, 'wb', buffering=0) as f:
+            fd = f.fileno()
+            try:
+                while not stopped and written_count < total_target:
+                    # Sleep until the parent signals, then take every batch queued so far
+                    new_data.wait()
+                    new_data.clear()
+                    while pending:
+                        batch = pending.popleft()
+                        if batch is None:  # Poison pill
+                            stopped = True
+                            break
+                        room.release()
+
+                        # One hexlify for the whole key buffer, sliced per line
+                        private_keys, addresses = batch
+                        hex_keys = hexlify(private_keys)
+                        buffer += b''.join([
+                            b'%b,%b\n' % (hex_keys[key_offset:key_offset + 64], addresses[offset:offset + 34])
+                            for key_offset, offset in zip(range(0, len(hex_keys), 64), range(0, len(addresses), 34))
+                        ])
+                        written_count += len(addresses) // 34
+
+                        # Write buffer when full
+                        if len(buffer) >= WRITE_CHUNK:
+                            self.write_all(fd, buffer)
+                            buffer.clear()
+            finally:
+                # Never leave the parent blocked on a writer that has stopped
+                room.release(total_target)
+
+                # Write remaining buffer, even if the loop stopped on an error
+                if buffer:
+                    self.write_all(fd, buffer)
 
     def generate_ultra_fast(self, count, output_file=None):
-        """Ultra fast generation with multi-threading"""
+        """Ultra fast generation with a pool of worker processes"""
         start_time = time.time()
-        print(f"Ultra-fast generating {count} addresses with {self.num_threads} threads...")
-
-        # Calculate work distribution
-        addresses_per_thread = count // self.num_threads
-        batch_size = 100  # Process in smaller batches for better responsiveness
-
-        # Start writer thread
+        print(f"Ultra-fast generating {count} addresses with {self.num_processes} processes...")
+
+        # Split the work into fixed-size tasks
+        tasks = [TASK_SIZE] * (count // TASK_SIZE)
+        if count % TASK_SIZE:
+            tasks.append(count % TASK_SIZE)
+
+        # Start writer thread; the parent feeds it as worker results arrive
+        # The parent is the only producer, so a plain deque (append/popleft are
+        # atomic) plus an Event replaces the Queue's lock and condition per batch;
+        # the room semaphore keeps at most MAX_PENDING_BATCHES in the deque
+        pending = None
+        new_data = threading.Event()
+        room = threading.Semaphore(MAX_PENDING_BATCHES)
         writer_future = None
         if output_file:
+            pending = deque()
             writer_future = threading.Thread(
                 target=self.writer_thread,
-                args=(output_file, count)
+                args=(pending, new_data, room, output_file, count)
             )
             writer_future.start()
 
-        # Start worker threads
-        with concurrent.futures.ThreadPoolExecutor(max_workers=self.num_threads) as executor:
-            futures = []
-
-            for thread_id in range(self.num_threads):
-                # Last thread handles remainder
-                thread_count = addresses_per_thread
-                if thread_id == self.num_threads - 1:
-                    thread_count += count % self.num_threads
-
-                future = executor.submit(
-                    self.worker_thread,
-                    thread_count,
-                    batch_size,
-                    thread_id
-                )
-                futures.append(future)
-
-            # Monitor progress
-            last_reported = 0
-            while self.total_generated < count:
-                time.sleep(0.1)
-                current = self.total_generated
-
-                if current >= last_reported + 10000:  # Report every 10k
-                    elapsed = time.time() - start_time
-                    rate = current / elapsed if elapsed > 0 else 0
-                    print(f"  Generated {current} addresses... Rate: {rate:.0f}/sec")
-                    last_reported = current
-
-            # Wait for all threads to complete
-            concurrent.futures.wait(futures)
-
-        # Signal writer to stop
-        if writer_future:
-            self.write_queue.put(None)  # Poison pill
-            writer_future.join()
+        pool_options = {}
+        if self.worker_cpus:
+            pool_options = {'initializer': _init_worker, 'initargs': (self.worker_cpus, multiprocessing.Value('i', 0))}
+
+        try:
+            with concurrent.futures.ProcessPoolExecutor(max_workers=self.num_processes, **pool_options) as executor:
+                # Consume results in task order and report progress
+                generated = 0
+                last_reported = 0
+                for batch in self.ordered_results(executor, tasks):
+                    generated += len(batch[1]) // 34
+                    if pending is not None:
+                        room.acquire()  # Wait here while the writer is MAX_PENDING_BATCHES behind
+                        pending.append(batch)
+                        if not new_data.is_set():  # Only take the Event's lock when the writer may be asleep
+                            new_data.set()
+
+                    if generated >= last_reported + 10000:  # Report every 10k
+                        elapsed = time.time() - start_time
+                        rate = generated / elapsed if elapsed > 0 else 0
+                        print(f"  Generated {generated} addresses... Rate: {rate:.0f}/sec")
+                        last_reported = generated
+        finally:
+            # Signal writer to stop, even if a worker raised
+            if writer_future:
+                pending.append(None)  # Poison pill
+                new_data.set()
+                writer_future.join()
 
         end_time = time.time()
         elapsed = end_time - start_time
@@ -206,20 +284,20 @@ class HighPerformanceGenerator:
 
 def main():
     if len(sys.argv) < 2:
-        print("Usage: python3 ultra_fast_generator.py <count> [output_file] [threads]")
-        print("Example: python3 ultra_fast_generator.py 100000 output.txt 20")
+        print("Usage: python3 ultra_fast_generator.py <count> [output_file] [processes]")
+        print("Example: python3 ultra_fast_generator.py 100000 output.txt 8")
         sys.exit(1)
 
     try:
         count = int(sys.argv[1])
         output_file = sys.argv[2] if len(sys.argv) > 2 else None
-        num_threads = int(sys.argv[3]) if len(sys.argv) > 3 else 20
+        num_processes = int(sys.argv[3]) if len(sys.argv) > 3 else None
 
         if count <= 0 or count > 10000000:
             print("Error: Count must be between 1 and 10,000,000")
             sys.exit(1)
 
-        generator = HighPerformanceGenerator(num_threads)
+        generator = HighPerformanceGenerator(num_processes)
         rate = generator.generate_ultra_fast(count, output_file)
 
         if rate >= 500000: